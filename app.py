@@ -56,6 +56,8 @@ from fastapi.exception_handlers import http_exception_handler
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+
+from utils.templates import get_templates
 from fastapi_csrf_protect import CsrfProtect
 from redis import Redis
 from redis.exceptions import RedisError
@@ -427,7 +429,7 @@ def init_app(
     app.state.ppe_worker = None
     app.state.alert_worker = None
     app.state.branding_path = branding_path
-    app.state.templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
+    app.state.templates = get_templates(str(TEMPLATE_DIR))
 
     monitor_readiness(app)
 
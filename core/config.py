@@ -13,11 +13,14 @@ import json
 import os
 import tempfile
 import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import redis
 
+from utils import jsonio
+
 try:
     import fcntl
 except ImportError:  # pragma: no cover - Windows doesn't provide fcntl
@@ -222,8 +225,8 @@ def _read_config_file(path: str) -> dict:
 
     if not os.path.exists(path):
         raise FileNotFoundError(path)
-    with open(path) as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return jsonio.loads(f.read())
 
 
 def _apply_defaults(data: dict) -> dict:
@@ -289,7 +292,7 @@ def _persist_to_redis(data: dict, redis_client: redis.Redis | None) -> None:
     """Store ``data`` in ``redis_client`` if provided."""
 
     if redis_client is not None:
-        redis_client.set("config", json.dumps(data))
+        redis_client.set("config", jsonio.dumps(data))
 
 
 # sync_detection_classes routine
@@ -437,11 +440,18 @@ BRANDING_DEFAULTS = {
 
 
 # load_branding routine
-def load_branding(path: str) -> dict:
-    """Load branding configuration from a JSON file."""
+# Branding changes only through :func:`save_branding`, so the parsed file
+# can be memoized and handed out until the version counter bumps. Renders
+# that pull branding per request then skip the disk read and defaults loop.
+_branding_version = 0
+
+
+@lru_cache(maxsize=1)
+def _branding_snapshot(path: str, version: int) -> dict:
+    """Return the parsed branding file for ``version`` of ``path``."""
     if os.path.exists(path):
-        with open(path) as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = jsonio.loads(f.read())
     else:
         data = {}
     for k, v in BRANDING_DEFAULTS.items():
@@ -449,9 +459,15 @@ def load_branding(path: str) -> dict:
     return data
 
 
+def load_branding(path: str) -> dict:
+    """Load branding configuration from a JSON file."""
+    return dict(_branding_snapshot(path, _branding_version))
+
+
 # save_branding routine
 def save_branding(data: dict, path: str) -> None:
     """Save branding configuration."""
+    global _branding_version
     dir_name = os.path.dirname(path)
     fd, tmp_path = tempfile.mkstemp(dir=dir_name or ".")
     try:
@@ -460,6 +476,7 @@ def save_branding(data: dict, path: str) -> None:
             f.flush()
             os.fsync(f.fileno())
         os.replace(tmp_path, path)
+        _branding_version += 1
     finally:
         try:
             os.remove(tmp_path)
@@ -40,11 +40,67 @@ def gather_stats(trackers: Dict[int, "PersonTracker"], r: redis.Redis) -> dict:
     }
 
 
+# Server-side compare-and-set: skips the HGETALL round trip and makes the
+# compare + HSET + PUBLISH + XADD atomic in a single EVALSHA. ARGV[1] is a
+# digest of the compared fields, ARGV[2] the full JSON payload and the rest
+# field/value pairs for the totals hash.
+_STATS_CAS_LUA = """
+if redis.call('HGET', KEYS[1], 'digest') == ARGV[1] then
+    return 0
+end
+local fields = {'digest', ARGV[1]}
+for i = 3, #ARGV do
+    fields[#fields + 1] = ARGV[i]
+end
+redis.call('HSET', KEYS[1], unpack(fields))
+redis.call('PUBLISH', 'stats_updates', ARGV[2])
+redis.call('XADD', KEYS[2], 'MAXLEN', '1', '*', 'data', ARGV[2])
+return 1
+"""
+
+_stats_cas_script = None
+
+
+def _broadcast_stats_cas(data: dict, r: redis.Redis) -> bool:
+    """Attempt the atomic Lua broadcast; return False to use the fallback."""
+    global _stats_cas_script
+    digest = json.dumps(
+        [
+            data.get("in_count", 0),
+            data.get("out_count", 0),
+            data.get("current", 0),
+            data.get("anomaly_counts", {}),
+            data.get("group_counts", {}),
+        ],
+        sort_keys=True,
+    )
+    payload = json.dumps(data)
+    args = [digest, payload]
+    for field in ("in_count", "out_count", "current", "max_capacity", "status"):
+        args += [field, str(data[field])]
+    args += ["anomaly_counts", json.dumps(data["anomaly_counts"])]
+    args += ["group_counts", json.dumps(data["group_counts"])]
+    try:
+        if _stats_cas_script is None:
+            _stats_cas_script = r.register_script(_STATS_CAS_LUA)
+        _stats_cas_script(
+            keys=["stats_totals", "stats_stream"], args=args, client=r
+        )
+    except (AttributeError, TypeError, redis.RedisError):
+        # Scripting unavailable (old server, restricted mode or test double).
+        _stats_cas_script = None
+        return False
+    return True
+
+
 # broadcast_stats routine
 def broadcast_stats(trackers: Dict[int, "PersonTracker"], r: redis.Redis) -> None:
     """Publish the latest stats if totals changed."""
     data = gather_stats(trackers, r)
 
+    if _broadcast_stats_cas(data, r):
+        return
+
     try:
         raw_totals = r.hgetall("stats_totals") or {}
     except redis.RedisError:
@@ -212,6 +212,7 @@ def stop_tracker(cam_id: int, trackers: Dict[int, PersonTracker]) -> None:
     tr = trackers.pop(cam_id, None)
     if tr:
         tr.running = False
+        tr.close()
     with lock:
         info = tracker_threads.pop(cam_id, None)
     if info and info.get("timer"):
@@ -223,11 +224,24 @@ def reset_counts(trackers: Dict[int, PersonTracker]) -> None:
     for tr in trackers.values():
         tr.in_count = 0
         tr.out_count = 0
+        # Zero the per-group breakdowns too; the totals are maintained
+        # incrementally from them during crossings.
+        for g in tr.in_counts:
+            tr.in_counts[g] = 0
+        for g in tr.out_counts:
+            tr.out_counts[g] = 0
         tr.tracks.clear()
         tr.prev_date = date.today()
-        tr.redis.mset(
-            {tr.key_in: 0, tr.key_out: 0, tr.key_date: tr.prev_date.isoformat()}
-        )
+        reset_data = {
+            tr.key_in: 0,
+            tr.key_out: 0,
+            tr.key_date: tr.prev_date.isoformat(),
+        }
+        for g in tr.in_counts:
+            reset_data[f"{tr.key_in}:{g}"] = 0
+        for g in tr.out_counts:
+            reset_data[f"{tr.key_out}:{g}"] = 0
+        tr.redis.mset(reset_data)
     logger.info("Counts reset")
 
 
@@ -241,9 +255,12 @@ def log_counts(r: redis.Redis, trackers: Dict[int, PersonTracker]) -> None:
         data[f"in_{g}"] = in_c
         data[f"out_{g}"] = out_c
     entry = json.dumps(data)
-    r.zadd("history", {entry: ts})
-    trim_sorted_set_sync(r, "history", ts)
-    r.zremrangebyrank("history", 0, -10001)
+    # One MULTI/EXEC round trip instead of three.
+    with r.pipeline(transaction=True) as pipe:
+        pipe.zadd("history", {entry: ts})
+        trim_sorted_set_sync(pipe, "history", ts)
+        pipe.zremrangebyrank("history", 0, -10001)
+        pipe.execute()
     from .stats import broadcast_stats
 
     broadcast_stats(trackers, r)
@@ -404,8 +421,6 @@ def handle_status_change(status: str, r: redis.Redis) -> None:
             "color": None,
             "path": None,
         }
-        r.zadd("ppe_logs", {json.dumps(entry): ts})
-        r.incr("ppe_report_version")
         cfg_data = r.get("config")
         limit = 1000
         retention_secs = 7 * 24 * 60 * 60
@@ -416,8 +431,13 @@ def handle_status_change(status: str, r: redis.Redis) -> None:
                 retention_secs = int(cfg.get("ppe_log_retention_secs", retention_secs))
             except (json.JSONDecodeError, ValueError, TypeError):
                 pass
-        trim_sorted_set_sync(r, "ppe_logs", ts, retention_secs)
-        r.zremrangebyrank("ppe_logs", 0, -limit - 1)
+        # One MULTI/EXEC round trip instead of four.
+        with r.pipeline(transaction=True) as pipe:
+            pipe.zadd("ppe_logs", {json.dumps(entry): ts})
+            pipe.incr("ppe_report_version")
+            trim_sorted_set_sync(pipe, "ppe_logs", ts, retention_secs)
+            pipe.zremrangebyrank("ppe_logs", 0, -limit - 1)
+            pipe.execute()
     elif status == "red":
         r.incr("red_alert_count")
         entry = {
@@ -429,8 +449,6 @@ def handle_status_change(status: str, r: redis.Redis) -> None:
             "color": None,
             "path": None,
         }
-        r.zadd("ppe_logs", {json.dumps(entry): ts})
-        r.incr("ppe_report_version")
         cfg_data = r.get("config")
         limit = 1000
         retention_secs = 7 * 24 * 60 * 60
@@ -441,5 +459,10 @@ def handle_status_change(status: str, r: redis.Redis) -> None:
                 retention_secs = int(cfg.get("ppe_log_retention_secs", retention_secs))
             except (json.JSONDecodeError, ValueError, TypeError):
                 pass
-        trim_sorted_set_sync(r, "ppe_logs", ts, retention_secs)
-        r.zremrangebyrank("ppe_logs", 0, -limit - 1)
+        # One MULTI/EXEC round trip instead of four.
+        with r.pipeline(transaction=True) as pipe:
+            pipe.zadd("ppe_logs", {json.dumps(entry): ts})
+            pipe.incr("ppe_report_version")
+            trim_sorted_set_sync(pipe, "ppe_logs", ts, retention_secs)
+            pipe.zremrangebyrank("ppe_logs", 0, -limit - 1)
+            pipe.execute()
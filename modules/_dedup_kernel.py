@@ -0,0 +1,47 @@
+"""Batch dHash kernel for frame deduplication.
+
+Computes 64-bit row-gradient hashes for a whole batch of downsampled
+grayscale frames at once. When Numba is installed the kernel is JIT
+compiled with ``parallel=True`` so multi-camera dedup hashes all streams
+outside the GIL; otherwise a vectorized NumPy path is used.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:  # optional acceleration
+    from numba import njit, prange  # type: ignore
+except Exception:  # pragma: no cover - numba optional
+    njit = None
+    prange = range
+
+
+def _dhash_batch_numpy(gray_batch: np.ndarray) -> np.ndarray:
+    """Vectorized fallback: hash an ``(N, 8, 9)`` uint8 batch."""
+    bits = gray_batch[:, :, 1:] > gray_batch[:, :, :-1]
+    packed = np.packbits(bits.reshape(bits.shape[0], -1), axis=1)
+    return packed.view(">u8").ravel().astype(np.uint64)
+
+
+if njit is not None:
+
+    @njit(cache=True, parallel=True, fastmath=True)  # pragma: no cover - jit
+    def _dhash_batch_jit(gray_batch):
+        n = gray_batch.shape[0]
+        out = np.empty(n, np.uint64)
+        for i in prange(n):
+            h = np.uint64(0)
+            for r in range(8):
+                for c in range(8):
+                    h = h << np.uint64(1)
+                    if gray_batch[i, r, c + 1] > gray_batch[i, r, c]:
+                        h |= np.uint64(1)
+            out[i] = h
+        return out
+
+    dhash_batch = _dhash_batch_jit
+else:
+    dhash_batch = _dhash_batch_numpy
+
+__all__ = ["dhash_batch"]
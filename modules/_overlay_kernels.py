@@ -0,0 +1,64 @@
+"""Bounding-box sanitation kernel for overlay drawing.
+
+Clamps and validates a whole ``(N, 4)`` box array in one call. When Numba
+is installed the scalar loop is JIT compiled, removing the NumPy temporary
+allocations of the vectorized path; otherwise the NumPy implementation is
+used.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:  # optional acceleration
+    from numba import njit  # type: ignore
+except Exception:  # pragma: no cover - numba optional
+    njit = None
+
+
+def _sanitize_bboxes_numpy(
+    boxes: np.ndarray, w: int, h: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized fallback: clamp boxes and flag valid rows."""
+    valid = np.isfinite(boxes).all(axis=1)
+    safe = np.where(valid[:, None], boxes, 0.0)
+    np.clip(safe[:, 0::2], 0, w - 1, out=safe[:, 0::2])
+    np.clip(safe[:, 1::2], 0, h - 1, out=safe[:, 1::2])
+    clamped = safe.astype(np.int32)
+    valid &= (clamped[:, 0] < clamped[:, 2]) & (clamped[:, 1] < clamped[:, 3])
+    return clamped, valid
+
+
+if njit is not None:
+
+    # fastmath deliberately off: it may elide the isfinite checks the
+    # kernel exists to perform.
+    @njit(cache=True)  # pragma: no cover - jit
+    def _sanitize_bboxes_jit(boxes, w, h):
+        n = boxes.shape[0]
+        out = np.zeros((n, 4), np.int32)
+        valid = np.zeros(n, np.bool_)
+        for i in range(n):
+            finite = True
+            for j in range(4):
+                if not np.isfinite(boxes[i, j]):
+                    finite = False
+                    break
+            if not finite:
+                continue
+            x1 = min(max(int(boxes[i, 0]), 0), w - 1)
+            y1 = min(max(int(boxes[i, 1]), 0), h - 1)
+            x2 = min(max(int(boxes[i, 2]), 0), w - 1)
+            y2 = min(max(int(boxes[i, 3]), 0), h - 1)
+            out[i, 0] = x1
+            out[i, 1] = y1
+            out[i, 2] = x2
+            out[i, 3] = y2
+            valid[i] = x1 < x2 and y1 < y2
+        return out, valid
+
+    sanitize_bboxes = _sanitize_bboxes_jit
+else:
+    sanitize_bboxes = _sanitize_bboxes_numpy
+
+__all__ = ["sanitize_bboxes"]
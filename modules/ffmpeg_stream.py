@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import os
+import re
+import selectors
 import shlex
 import subprocess
 import threading
@@ -12,10 +14,16 @@ from functools import lru_cache
 from typing import Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
+import cv2
 import ffmpeg
 import numpy as np
 from loguru import logger
 
+try:  # POSIX only; used to enlarge the FFmpeg stdout pipe
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
 from config import config as shared_config
 
 from .base_camera import BaseCameraStream
@@ -29,6 +37,7 @@ PIXEL_FORMAT_BYTES = {
     "gray8": 1,
     "bgra": 4,
     "rgba": 4,
+    "nv12": 1.5,
 }
 
 ERROR_PATTERNS = {
@@ -110,6 +119,110 @@ ERROR_PATTERNS = {
     ),
 }
 
+# Compiled once at import: a single case-insensitive alternation pass over
+# the stderr buffer replaces one lower-cased substring scan per pattern.
+_ERROR_PATTERN_RE = re.compile(
+    "|".join(re.escape(pat) for pat in ERROR_PATTERNS), re.IGNORECASE
+)
+_ERROR_PATTERNS_LOWER = {pat.lower(): val for pat, val in ERROR_PATTERNS.items()}
+
+
+class _StderrMultiplexer:
+    """Drain every FFmpeg stderr pipe from one selector thread.
+
+    A dedicated blocking-readline thread per stream costs one OS thread per
+    camera; registering all stderr fds (set non-blocking) with a single
+    ``DefaultSelector`` collapses that to one thread total. Each fd carries
+    a callback receiving complete decoded lines; partial lines are buffered
+    until their newline arrives and an fd is dropped automatically on EOF.
+    """
+
+    def __init__(self) -> None:
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._partials: dict[int, bytes] = {}
+        self._thread: threading.Thread | None = None
+        # Self-pipe so a blocked select() notices new registrations.
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_r, False)
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ, None)
+
+    def register(self, fd: int, callback) -> None:
+        os.set_blocking(fd, False)
+        with self._lock:
+            self._partials[fd] = b""
+            self._selector.register(fd, selectors.EVENT_READ, callback)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._loop, daemon=True, name="ffmpeg-stderr-mux"
+                )
+                self._thread.start()
+        os.write(self._wakeup_w, b"\0")
+
+    def unregister(self, fd: int) -> None:
+        with self._lock:
+            try:
+                self._selector.unregister(fd)
+            except (KeyError, ValueError, OSError):
+                pass
+            self._partials.pop(fd, None)
+
+    def _loop(self) -> None:
+        while True:
+            try:
+                events = self._selector.select(timeout=1.0)
+            except (OSError, RuntimeError):  # fd unregistered mid-select
+                continue
+            for key, _ in events:
+                if key.data is None:
+                    try:
+                        os.read(self._wakeup_r, 4096)
+                    except OSError:
+                        pass
+                    continue
+                self._drain_fd(key.fd, key.data)
+
+    def _drain_fd(self, fd: int, callback) -> None:
+        chunks: list[bytes] = []
+        closed = False
+        while True:
+            try:
+                chunk = os.read(fd, 4096)
+            except BlockingIOError:
+                break
+            except OSError:
+                closed = True
+                break
+            if not chunk:
+                closed = True
+                break
+            chunks.append(chunk)
+        data = self._partials.get(fd, b"") + b"".join(chunks)
+        *lines, rest = data.split(b"\n")
+        self._partials[fd] = rest
+        for line in lines:
+            callback(line.decode("utf-8", errors="ignore").rstrip())
+        if closed:
+            if rest:
+                callback(rest.decode("utf-8", errors="ignore").rstrip())
+            self.unregister(fd)
+
+
+_stderr_mux = _StderrMultiplexer()
+
+
+@lru_cache(maxsize=1)
+def _available_hwaccels() -> frozenset[str]:
+    """Return the hardware acceleration methods the local FFmpeg offers."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hwaccels"], capture_output=True, text=True, check=False
+        )
+    except Exception:
+        return frozenset()
+    lines = result.stdout.splitlines()
+    return frozenset(line.strip() for line in lines[1:] if line.strip())
+
 
 @lru_cache(maxsize=1)
 def _supports_drop() -> bool:
@@ -148,6 +261,7 @@ class FFmpegCameraStream(BaseCameraStream):
         mirror: bool = False,
         orientation: str = "vertical",
         timeout: float = 5.0,
+        hwaccel: str | None = None,
     ) -> None:
 
         from utils.url import normalize_stream_url
@@ -184,10 +298,30 @@ class FFmpegCameraStream(BaseCameraStream):
                 self.extra_flags = [str(f) for f in extra_flags]
         self.reconnect_delay = reconnect_delay
         self.timeout = timeout
+        self.low_latency_flags = bool(shared_config.get("low_latency_flags", True))
+        hwaccel = hwaccel or shared_config.get("ffmpeg_hwaccel")
+        if hwaccel and hwaccel not in _available_hwaccels():
+            logger.warning(
+                "Requested hwaccel {} not offered by FFmpeg; using software decode",
+                hwaccel,
+            )
+            hwaccel = None
+        self.hwaccel = hwaccel
         self.high_watermark = shared_config.get("ffmpeg_high_watermark", 0)
         self.low_watermark = shared_config.get("ffmpeg_low_watermark", 0)
         self.logger = logger.bind(cam_id=cam_id, backend="ffmpeg")
         self.frame_skip = max(1, frame_skip)
+        # Decimate inside FFmpeg where possible: a ``select`` filter stops
+        # skipped frames from ever being decoded or piped, saving
+        # (frame_skip - 1) x frame_size bytes/s of pipe traffic. Set
+        # ``ffmpeg_select_skip`` false to fall back to the Python-side
+        # discard loop (cheaper for very high-FPS sources where select's
+        # per-frame expression evaluation shows up).
+        self.ffmpeg_select_skip = (
+            self.frame_skip > 1
+            and not test
+            and bool(shared_config.get("ffmpeg_select_skip", True))
+        )
         self.network_error_count = 0
         self.network_error_threshold = int(
             shared_config.get("ffmpeg_network_error_threshold", 3)
@@ -201,7 +335,7 @@ class FFmpegCameraStream(BaseCameraStream):
         ):
             from .duplicate_filter import DuplicateFilter
 
-            threshold = shared_config.get("duplicate_filter_threshold", 2)
+            threshold = shared_config.get("duplicate_filter_threshold", 5)
             bypass = shared_config.get("duplicate_bypass_seconds", 2)
             self.dup_filter = DuplicateFilter(threshold, bypass)
             if self.high_watermark and not self.ffmpeg_drop_enabled:
@@ -215,15 +349,41 @@ class FFmpegCameraStream(BaseCameraStream):
                 self.logger.info(
                     "FFmpeg dropping enabled; Python duplicate filter disabled",
                 )
-        self.pix_fmt = "bgr24"
-        self.channels = PIXEL_FORMAT_BYTES.get(self.pix_fmt, 3)
+        # nv12 moves 1.5 bytes/pixel over the pipe versus 3 for bgr24; the
+        # SIMD cvtColor back to BGR is far cheaper than the saved memcpy.
+        self.pix_fmt = str(shared_config.get("ffmpeg_pipe_pix_fmt", "nv12"))
+        if self.pix_fmt not in PIXEL_FORMAT_BYTES:
+            self.logger.warning(
+                "Unknown pipe pix_fmt {}; using bgr24", self.pix_fmt
+            )
+            self.pix_fmt = "bgr24"
+        self.channels = 3
         self._probe_stream()
         if self.test and self.downscale and self.downscale > 1:
             self.width //= self.downscale
             self.height //= self.downscale
+        if self.pix_fmt == "nv12" and (self.width % 2 or self.height % 2):
+            # nv12 subsampling needs even dimensions.
+            self.pix_fmt = "bgr24"
         bytes_per_pixel = PIXEL_FORMAT_BYTES.get(self.pix_fmt, 3)
-        self.channels = bytes_per_pixel
-        self.frame_size = self.width * self.height * bytes_per_pixel
+        # ``channels`` describes the frames handed to consumers; nv12 is
+        # converted to 3-channel BGR on read.
+        self.channels = 3 if self.pix_fmt == "nv12" else int(bytes_per_pixel)
+        self.frame_size = int(self.width * self.height * bytes_per_pixel)
+        # Reused scratch for nv12 payloads before color conversion; avoids
+        # per-frame allocation in the memory-bound pipe drain path. Packed
+        # formats are read straight into the ring slot instead.
+        self._read_arr = np.empty(self.frame_size, dtype=np.uint8)
+        self._stdout_fd: int | None = None
+        # Bounded ring of preallocated frame slots (one contiguous block).
+        # The capture thread cycles through slots instead of allocating a
+        # fresh ndarray per frame; a slot is only overwritten after the
+        # rolling buffer has already evicted the frame that used it.
+        self._ring = np.empty(
+            (max(2, buffer_size), self.height, self.width, self.channels),
+            dtype=np.uint8,
+        )
+        self._ring_idx = 0
         self.logger.debug(
             "Initialized FFmpegCameraStream with frame_size={}",
             self.frame_size,
@@ -244,15 +404,23 @@ class FFmpegCameraStream(BaseCameraStream):
             self.cmd = None
             self.pipeline = ""
             self.last_command = ""
+        # Built commands memoized per transport; invalidated when the
+        # decode configuration changes (e.g. hwaccel fallback).
+        self._cmd_cache: dict[str, list[str]] = {}
         self.last_status: str = "ok"
         self.last_error: str = ""
         self._stderr_buffer = deque(maxlen=200)
+        # Version counter + cached join so hot readers pay O(1) unless new
+        # stderr lines arrived since the last snapshot.
+        self._stderr_version = 0
+        self._stderr_cache: tuple[str, int] = ("", 0)
 
         self._stderr_thread: threading.Thread | None = None
+        self._stderr_fd: int | None = None
         self._stderr_stop = threading.Event()
         self.last_stderr: str = ""
         self.first_frame_timeout = float(shared_config.get("ready_timeout", 15.0))
-        self._first_frame_start = time.time()
+        self._first_frame_start = time.monotonic()
         self._successful_transport: str | None = None
         super().__init__(buffer_size, start_thread=start_thread)
         if not start_thread:
@@ -339,17 +507,47 @@ class FFmpegCameraStream(BaseCameraStream):
             "500000",
         ]
 
+        if self.low_latency_flags and not self.test:
+            # Trim FFmpeg's internal demuxer/mux buffering so frames hit the
+            # pipe as soon as they are decoded.
+            cmd += [
+                "-max_delay",
+                "0",
+                "-flush_packets",
+                "1",
+                "-avioflags",
+                "direct",
+            ]
+
         if self.extra_flags:
             cmd += self.extra_flags
 
+        if self.hwaccel:
+            # Fixed-function hardware decode; frees most of a core per
+            # stream versus software h264/h265 decode.
+            cmd += ["-hwaccel", self.hwaccel]
+            if self.hwaccel == "cuda":
+                cmd += ["-hwaccel_output_format", "cuda"]
+
         cmd += ["-i", self.url]
 
         filters: list[str] = []
+        if self.hwaccel == "cuda":
+            # Frames decode into GPU memory; bring them back as bgr24 before
+            # the CPU-side filters below run.
+            filters.append(f"hwdownload,format={self.pix_fmt}")
         if self.test:
             filters.append("fps=1")
             if self.downscale and self.downscale > 1:
                 filters.append(f"scale=iw/{self.downscale}:ih/{self.downscale}")
         else:
+            if self.ffmpeg_select_skip:
+                # setpts rewrites timestamps so the surviving frames play
+                # back-to-back instead of stalling the rawvideo muxer.
+                filters.append(
+                    f"select='not(mod(n\\,{self.frame_skip}))',"
+                    "setpts=N/FRAME_RATE/TB"
+                )
             if self.downscale and self.downscale > 1:
                 filters.append(f"scale=iw/{self.downscale}:ih/{self.downscale}")
 
@@ -375,7 +573,7 @@ class FFmpegCameraStream(BaseCameraStream):
             "-vcodec",
             "rawvideo",
             "-pix_fmt",
-            "bgr24",
+            self.pix_fmt,
             "-f",
             "rawvideo",
             "-",
@@ -385,8 +583,13 @@ class FFmpegCameraStream(BaseCameraStream):
 
     # _start_process routine
     def _start_process(self) -> None:
-        if self.cmd is None:
-            cmd = self.build_ffmpeg_cmd()
+        if self.command is None:
+            # Memoized per transport so flapping reconnects (and transport
+            # retries) reuse the argv instead of rebuilding it each time.
+            cmd = self._cmd_cache.get(self.transport)
+            if cmd is None:
+                cmd = self.build_ffmpeg_cmd()
+                self._cmd_cache[self.transport] = cmd
             self.pipeline = " ".join(cmd)
             self.cmd = cmd
             self.last_command = self.pipeline
@@ -399,6 +602,7 @@ class FFmpegCameraStream(BaseCameraStream):
                 cmd.insert(1, "-nostdin")
             self.logger.info("FFmpeg custom command: {}", self.pipeline)
         self._stderr_buffer.clear()
+        self._stderr_version += 1
         self._stderr_stop.clear()
         self.last_stderr = ""
         creationflags = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
@@ -411,10 +615,12 @@ class FFmpegCameraStream(BaseCameraStream):
             creationflags=creationflags,
         )
         self._stderr_buffer.clear()
+        self._stderr_version += 1
         self._stderr_stop.clear()
         self.last_stderr = ""
-        self._first_frame_start = time.time()
+        self._first_frame_start = time.monotonic()
 
+        self._stdout_fd = None
         if not self.proc or getattr(self.proc, "stdout", None) is None:
             self.last_status = "error"
             self.last_error = (
@@ -433,22 +639,56 @@ class FFmpegCameraStream(BaseCameraStream):
             self._stderr_thread = None
             return
 
-        if getattr(self.proc, "stderr", None):
+        try:
+            # Raw fd lets _read_full_frame bypass the BufferedReader lock and
+            # its intermediate copy; None for non-file test doubles.
+            self._stdout_fd = self.proc.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            self._stdout_fd = None
+
+        if self._stdout_fd is not None and fcntl and hasattr(fcntl, "F_SETPIPE_SZ"):
+            # The default 64 KiB pipe forces ~100 wakeups per HD frame; a
+            # 1 MiB pipe lets FFmpeg write and Python drain in far fewer
+            # syscalls. Best effort: the kernel may cap the size.
+            try:
+                fcntl.fcntl(self._stdout_fd, fcntl.F_SETPIPE_SZ, 1 << 20)
+            except OSError:
+                pass
 
-            def _drain() -> None:
-                while not self._stderr_stop.is_set():
-                    try:
-                        line = self.proc.stderr.readline()
-                    except Exception:
-                        break
-                    if not line:
-                        break
-                    self._stderr_buffer.append(
-                        line.decode("utf-8", errors="ignore").rstrip()
-                    )
+        if getattr(self.proc, "stderr", None):
+            try:
+                stderr_fd = self.proc.stderr.fileno()
+            except (AttributeError, OSError, ValueError):
+                stderr_fd = None
+            if stderr_fd is not None:
+                # All streams share one selector thread instead of one
+                # blocking readline thread each.
+                def _append(line: str, self=self) -> None:
+                    self._stderr_buffer.append(line)
+                    self._stderr_version += 1
+
+                if self._stderr_fd is not None:
+                    _stderr_mux.unregister(self._stderr_fd)
+                self._stderr_fd = stderr_fd
+                _stderr_mux.register(stderr_fd, _append)
+                self._stderr_thread = None
+            else:  # non-file test doubles keep the dedicated thread
+
+                def _drain() -> None:
+                    while not self._stderr_stop.is_set():
+                        try:
+                            line = self.proc.stderr.readline()
+                        except Exception:
+                            break
+                        if not line:
+                            break
+                        self._stderr_buffer.append(
+                            line.decode("utf-8", errors="ignore").rstrip()
+                        )
+                        self._stderr_version += 1
 
-            self._stderr_thread = threading.Thread(target=_drain, daemon=True)
-            self._stderr_thread.start()
+                self._stderr_thread = threading.Thread(target=_drain, daemon=True)
+                self._stderr_thread.start()
         else:
             self._stderr_thread = None
         self.last_status = "ok"
@@ -467,24 +707,79 @@ class FFmpegCameraStream(BaseCameraStream):
             self.last_command = self.pipeline
             self.proc = None
 
-    def _read_full_frame(self) -> bytes | None:
-        """Read exactly one frame from the FFmpeg stdout pipe."""
+    def _read_full_frame(self) -> np.ndarray | None:
+        """Read exactly one frame from the FFmpeg stdout pipe.
+
+        A real pipe is drained with ``os.readv`` on the raw fd, scattering
+        straight into a preallocated target; this skips the BufferedReader
+        lock and its intermediate copy, costing exactly one syscall per pipe
+        refill. Packed formats land directly in the next ring slot so
+        ``_decode_raw`` needs no copy at all; nv12 goes through the scratch
+        buffer it is color-converted from. Non-file test doubles fall back
+        to a ``readinto``/``read`` loop over the same target. The returned
+        view is reused by the next call, so callers that keep the frame must
+        copy it.
+        """
         proc = self.proc
         if proc is None or getattr(proc, "stdout", None) is None:
             return None
-        buffer = b""
-        while len(buffer) < self.frame_size:
+        if self.pix_fmt == "nv12":
+            target = self._read_arr
+        else:
+            target = self._ring[self._ring_idx].reshape(-1)
+        mv = memoryview(target)
+        off = 0
+        fd = self._stdout_fd
+        if fd is not None:
+            while off < self.frame_size:
+                try:
+                    n = os.readv(fd, [mv[off:]])
+                except BlockingIOError:
+                    time.sleep(0.001)
+                    continue
+                except (OSError, ValueError):
+                    return None
+                if not n:
+                    return None
+                off += n
+            return target
+        while off < self.frame_size:
             stdout = getattr(proc, "stdout", None)
             if stdout is None or proc.poll() is not None:
                 return None
-            try:
-                chunk = stdout.read(self.frame_size - len(buffer))
-            except AttributeError:
-                return None
-            if not chunk:
-                return None
-            buffer += chunk
-        return buffer
+            readinto = getattr(stdout, "readinto", None)
+            if readinto is not None:
+                n = readinto(mv[off:])
+                if not n:
+                    return None
+                off += n
+            else:  # test doubles only expose read()
+                try:
+                    chunk = stdout.read(self.frame_size - off)
+                except AttributeError:
+                    return None
+                if not chunk:
+                    return None
+                mv[off : off + len(chunk)] = chunk
+                off += len(chunk)
+        return target
+
+    def _decode_raw(self, raw: np.ndarray) -> np.ndarray:
+        """Expand flat raw pipe bytes into the next BGR ring slot.
+
+        nv12 payloads are color-converted with the SIMD ``cvtColor`` kernel
+        writing straight into the slot; packed formats were already read
+        into the slot by ``_read_full_frame`` and only need reshaping, so
+        the hot path carries zero redundant copies.
+        """
+        slot = self._ring[self._ring_idx]
+        if self.pix_fmt == "nv12":
+            yuv = raw.reshape(self.height * 3 // 2, self.width)
+            cv2.cvtColor(yuv, cv2.COLOR_YUV2BGR_NV12, dst=slot)
+        elif raw.base is not self._ring:
+            slot[...] = raw.reshape(self.height, self.width, self.channels)
+        self._ring_idx = (self._ring_idx + 1) % self._ring.shape[0]
+        return slot
 
     def _next_transport(self) -> bool:
         """Switch to the next transport if available."""
@@ -505,7 +800,8 @@ class FFmpegCameraStream(BaseCameraStream):
     def _read_frame(self) -> Tuple[bool, Optional[np.ndarray]]:
         if (
             not self.initialized
-            and time.time() - self._first_frame_start > self.first_frame_timeout
+            and time.monotonic() - self._first_frame_start
+            > self.first_frame_timeout
         ):
             if self._next_transport():
                 return False, None
@@ -527,7 +823,8 @@ class FFmpegCameraStream(BaseCameraStream):
                 self.last_error = str(e)
                 time.sleep(self.reconnect_delay)
             return False, None
-        for _ in range(self.frame_skip - 1):
+        python_skip = 0 if self.ffmpeg_select_skip else self.frame_skip - 1
+        for _ in range(python_skip):
             if self._read_full_frame() is None:
                 self._log_failure("short read")
                 if not self.running:
@@ -558,10 +855,11 @@ class FFmpegCameraStream(BaseCameraStream):
                 time.sleep(self.reconnect_delay)
             return False, None
         try:
-            frame = np.frombuffer(raw, dtype="uint8").reshape(
-                self.height, self.width, self.channels
-            )
-        except ValueError:
+            # Expands the reused read buffer into the next ring slot; reuses
+            # warm memory instead of allocating per frame. The view stays
+            # valid until the ring wraps back around.
+            frame = self._decode_raw(raw)
+        except (ValueError, cv2.error):
             self._log_failure("reshape failed")
             return False, None
 
@@ -570,7 +868,7 @@ class FFmpegCameraStream(BaseCameraStream):
 
         if self._successful_transport is None:
             self._successful_transport = self.transport
-            err = "\n".join(self._stderr_buffer).strip()
+            err = self._stderr_text().strip()
             if err:
                 self.logger.info(
                     "First frame received via {} (stderr: {})",
@@ -584,17 +882,17 @@ class FFmpegCameraStream(BaseCameraStream):
     # wait_first_frame routine
     def wait_first_frame(self, timeout: float) -> np.ndarray:
         """Block until the first frame is read or ``timeout`` seconds elapse."""
-        deadline = time.time() + timeout
-        while time.time() < deadline:
+        # Monotonic avoids both the wall-clock syscall churn and the
+        # time-went-backwards edge case on NTP adjustments.
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
             raw = self._read_full_frame()
-            if raw:
+            if raw is not None:
                 try:
-                    frame = np.frombuffer(raw, dtype="uint8").reshape(
-                        self.height, self.width, 3
-                    )
+                    frame = self._decode_raw(raw).copy()
                     if self._successful_transport is None:
                         self._successful_transport = self.transport
-                    err = "\n".join(self._stderr_buffer).strip()
+                    err = self._stderr_text().strip()
                     if err:
                         self.logger.info(
                             "First frame received via {} (stderr: {})",
@@ -604,7 +902,7 @@ class FFmpegCameraStream(BaseCameraStream):
                     else:
                         self.logger.info("First frame received via {}", self.transport)
                     return frame
-                except ValueError:
+                except (ValueError, cv2.error):
                     self._log_failure("reshape failed")
                     break
             if self.proc is None or self.proc.poll() is not None:
@@ -612,7 +910,7 @@ class FFmpegCameraStream(BaseCameraStream):
                 break
             time.sleep(0.01)
         self._release_stream()
-        stderr_tail = "\n".join(self._stderr_buffer)
+        stderr_tail = self._stderr_text()
         self.last_status = "timeout"
         self.last_error = "no frame received"
         self.last_stderr = stderr_tail
@@ -624,18 +922,26 @@ class FFmpegCameraStream(BaseCameraStream):
     def _log_failure(self, reason: str) -> None:
         if not self.proc:
             return
-        err = "\n".join(self._stderr_buffer)
+        err = self._stderr_text()
         status = "error"
         message = reason or "unknown error"
         hint = ""
         if err.strip():
-            err_lower = err.lower()
-            for pat, (code, msg, h) in ERROR_PATTERNS.items():
-                if pat.lower() in err_lower:
-                    status = code
-                    message = msg
-                    hint = h
-                    break
+            match = _ERROR_PATTERN_RE.search(err)
+            if match:
+                status, message, hint = _ERROR_PATTERNS_LOWER[
+                    match.group(0).lower()
+                ]
+        if status == "codec" and self.hwaccel:
+            # Hardware decoders reject some profiles; retry in software.
+            self.logger.warning(
+                "Hardware decode ({}) failed; falling back to software decode",
+                self.hwaccel,
+            )
+            self.hwaccel = None
+            if self.command is None:
+                self.cmd = None
+                self._cmd_cache.clear()
         self.logger.error("FFmpeg {}. cmd: {}", reason, self.pipeline)
 
         if err.strip():
@@ -662,7 +968,7 @@ class FFmpegCameraStream(BaseCameraStream):
             self.network_error_count = 0
 
     def _log_retry(self) -> None:
-        err = "\n".join(self._stderr_buffer).strip()
+        err = self._stderr_text().strip()
         if err:
             self.logger.warning(
                 "Retrying FFmpeg with {} (stderr: {})", self.transport, err
@@ -675,10 +981,14 @@ class FFmpegCameraStream(BaseCameraStream):
         if self.proc:
             self.proc.kill()
         self._stderr_stop.set()
+        if self._stderr_fd is not None:
+            _stderr_mux.unregister(self._stderr_fd)
+            self._stderr_fd = None
         if self._stderr_thread and self._stderr_thread.is_alive():
             self._stderr_thread.join(timeout=0.1)
         self._stderr_thread = None
         self.proc = None
+        self._stdout_fd = None
         self.frames.clear()
 
     # read routine
@@ -687,10 +997,18 @@ class FFmpegCameraStream(BaseCameraStream):
             return super().read()
         return self._read_frame()
 
+    def _stderr_text(self) -> str:
+        """Return the joined stderr tail, re-joining only when it changed."""
+        text, version = self._stderr_cache
+        if version != self._stderr_version:
+            text = "\n".join(self._stderr_buffer)
+            self._stderr_cache = (text, self._stderr_version)
+        return text
+
     @property
     def stderr(self) -> str:
         """Return collected FFmpeg stderr output."""
-        return "\n".join(self._stderr_buffer)
+        return self._stderr_text()
 
     @property
     def successful_transport(self) -> str | None:
@@ -0,0 +1,57 @@
+"""Pool of reusable frame-sized buffers.
+
+Frames dropped from the tracker queues are fed back here instead of
+being left to the garbage collector, and frame-shaped scratch buffers
+(overlay copies, color-conversion targets) are served from the pool so
+the steady state allocates nothing.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+
+import numpy as np
+
+
+# FramePool class encapsulates framepool behavior
+class FramePool:
+    """Thread-safe pool of ndarray buffers keyed by shape and dtype."""
+
+    def __init__(self, max_buffers: int = 8) -> None:
+        self.max_buffers = max_buffers
+        self._free: dict[tuple, deque[np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    # acquire routine
+    def acquire(self, shape: tuple, dtype=np.uint8) -> np.ndarray:
+        """Return a buffer of ``shape``/``dtype``, reusing one if possible."""
+        key = (tuple(shape), np.dtype(dtype).str)
+        with self._lock:
+            bufs = self._free.get(key)
+            if bufs:
+                return bufs.pop()
+        return np.empty(shape, dtype)
+
+    # release routine
+    def release(self, buf) -> None:
+        """Return ``buf`` to the pool if it owns its memory.
+
+        Views into backend ring buffers (``buf.base`` set) and read-only
+        arrays are silently ignored — recycling those as writable scratch
+        would corrupt frames still live elsewhere.
+        """
+        if (
+            not isinstance(buf, np.ndarray)
+            or buf.base is not None
+            or not buf.flags["C_CONTIGUOUS"]
+            or not buf.flags["WRITEABLE"]
+        ):
+            return
+        key = (buf.shape, buf.dtype.str)
+        with self._lock:
+            bufs = self._free.setdefault(key, deque(maxlen=self.max_buffers))
+            bufs.append(buf)
+
+
+__all__ = ["FramePool"]
@@ -1,12 +1,17 @@
 """Simple OpenCV VideoCapture wrapper with a rolling buffer.
 
-`buffer_size` tunes the underlying ``cv2.CAP_PROP_BUFFERSIZE`` to trade
-latency for resilience. Smaller values reduce lag for local cameras.
+The driver-side queue is pinned to a single frame (``CAP_PROP_BUFFERSIZE``
+= 1) so reads always see the newest frame instead of one delayed by up to
+``buffer_size - 1`` frame periods; ``buffer_size`` still sizes the Python
+rolling buffer. Because many drivers ignore the property, ``_read_frame``
+additionally drains any backlog with decode-free ``grab()`` calls before
+decoding a frame with ``retrieve()``.
 """
 
 from __future__ import annotations
 
 import platform
+import time
 from typing import Optional, Tuple
 
 import cv2
@@ -17,6 +22,10 @@ from .base_camera import BaseCameraStream
 
 logger = logger.bind(module="opencv_stream")
 
+# Upper bound on decode-free catch-up grabs per read; keeps a wildly wrong
+# FPS estimate from spinning on a live source.
+_MAX_DRAIN_GRABS = 10
+
 
 # OpenCVCameraStream class encapsulates opencvcamerastream behavior
 class OpenCVCameraStream(BaseCameraStream):
@@ -26,7 +35,7 @@ class OpenCVCameraStream(BaseCameraStream):
         src,
         width: Optional[int] = None,
         height: Optional[int] = None,
-        buffer_size: int = 3,
+        buffer_size: int = 1,
         cam_id: int | str | None = None,
     ) -> None:
         from utils.url import normalize_stream_url
@@ -39,6 +48,8 @@ class OpenCVCameraStream(BaseCameraStream):
         self.cap: Optional[cv2.VideoCapture] = None
         self.last_status: str = "ok"
         self.last_error: str = ""
+        self._frame_period: Optional[float] = None
+        self._last_read = 0.0
         super().__init__(buffer_size)
 
     # _init_stream routine
@@ -54,7 +65,15 @@ class OpenCVCameraStream(BaseCameraStream):
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
         if hasattr(cv2, "CAP_PROP_BUFFERSIZE"):
-            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, self.buffer_size)
+            # Keep the driver queue at one frame regardless of the Python
+            # rolling buffer size; deeper queues only add delivery delay.
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            if self.cap.get(cv2.CAP_PROP_BUFFERSIZE) not in (0, 1):
+                self.logger.warning(
+                    "Driver ignored CAP_PROP_BUFFERSIZE; relying on grab drain"
+                )
+        fps = self.cap.get(cv2.CAP_PROP_FPS) if self.cap else 0
+        self._frame_period = 1.0 / fps if fps and fps > 0 else None
         if not self.cap.isOpened():
             self.last_status = "error"
             self.last_error = "could not open device"
@@ -66,7 +85,18 @@ class OpenCVCameraStream(BaseCameraStream):
             self.last_status = "error"
             self.last_error = "capture not initialized"
             return False, None
+        # If the consumer stalled for more than a frame period, frames have
+        # queued up in the driver. grab() demuxes without decoding, so the
+        # stale backlog is dropped at near-zero cost and only the newest
+        # frame pays for a decode in retrieve().
+        now = time.monotonic()
+        if self._frame_period and self._last_read:
+            backlog = int((now - self._last_read) / self._frame_period) - 1
+            for _ in range(min(backlog, _MAX_DRAIN_GRABS)):
+                if not self.cap.grab():
+                    break
         ret, frame = self.cap.read()
+        self._last_read = time.monotonic()
         if not ret or frame is None:
             self.last_status = "error"
             self.last_error = "failed to read frame"
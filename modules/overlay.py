@@ -1,9 +1,14 @@
 """Drawing routines for overlays on video frames."""
 
 import math
+from collections import deque
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
 import cv2
+import numpy as np
+
+from ._overlay_kernels import sanitize_bboxes
 
 
 def _sanitize_bbox(
@@ -23,6 +28,17 @@ def _sanitize_bbox(
     return xi1, yi1, xi2, yi2
 
 
+def _sanitize_bboxes(boxes: np.ndarray, w: int, h: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Batched :func:`_sanitize_bbox` over an ``(N, 4)`` float array.
+
+    Returns the clamped integer boxes plus a boolean validity mask; rows
+    with non-finite coordinates or degenerate extents are flagged invalid.
+    The clamp/validate loop itself lives in :mod:`._overlay_kernels`,
+    JIT compiled when Numba is present.
+    """
+    return sanitize_bboxes(np.ascontiguousarray(boxes, dtype=np.float32), w, h)
+
+
 def _sanitize_point(x: float, y: float, w: int, h: int) -> Tuple[int, int] | None:
     """Validate and clamp a point to frame bounds."""
     if not (math.isfinite(x) and math.isfinite(y)):
@@ -38,6 +54,56 @@ def _get_text_size(text: str, font, scale: float, thickness: int) -> Tuple[int,
     return cv2.getTextSize(text, font, scale, thickness)[0]
 
 
+@lru_cache(maxsize=4096)
+def _text_tile(
+    text: str, scale: float, color: Tuple[int, int, int], thickness: int
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Rasterize ``text`` once, returning the tile, its mask and baseline row.
+
+    Track labels are mostly stable between frames, so caching the rendered
+    glyph strip turns the repeated FreeType rasterization in ``putText``
+    into a masked memcpy blit.
+    """
+    (tw, th), baseline = cv2.getTextSize(
+        text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness
+    )
+    tile = np.zeros((th + baseline + thickness, tw + thickness, 3), dtype=np.uint8)
+    cv2.putText(
+        tile,
+        text,
+        (0, th),
+        cv2.FONT_HERSHEY_SIMPLEX,
+        scale,
+        color,
+        thickness,
+        lineType=cv2.LINE_8,
+    )
+    return tile, tile.any(axis=2), th
+
+
+def _blit_text(
+    frame,
+    text: str,
+    org: Tuple[int, int],
+    scale: float,
+    color: Tuple[int, int, int],
+    thickness: int = 2,
+) -> None:
+    """Draw ``text`` with baseline at ``org`` from the rasterized tile cache."""
+    tile, mask, baseline_row = _text_tile(text, scale, tuple(color), thickness)
+    h, w = frame.shape[:2]
+    x, y0 = org[0], org[1] - baseline_row
+    ty0, tx0 = max(0, -y0), max(0, -x)
+    y1 = min(h, y0 + tile.shape[0])
+    x1 = min(w, x + tile.shape[1])
+    if y1 <= max(y0, 0) or x1 <= max(x, 0):
+        return
+    region = frame[max(y0, 0) : y1, max(x, 0) : x1]
+    sub_tile = tile[ty0 : ty0 + region.shape[0], tx0 : tx0 + region.shape[1]]
+    sub_mask = mask[ty0 : ty0 + region.shape[0], tx0 : tx0 + region.shape[1]]
+    region[sub_mask] = sub_tile[sub_mask]
+
+
 def _draw_counting_line(frame, line_orientation: str, line_ratio: float) -> None:
     """Draw the counting line on ``frame``."""
     h, w = frame.shape[:2]
@@ -48,35 +114,71 @@ def _draw_counting_line(frame, line_orientation: str, line_ratio: float) -> None
         cv2.line(frame, (line_pos, 0), (line_pos, h), (255, 0, 0), 2)
 
 
+_UNSET = object()
+
+
+def _draw_trail(frame, trail, scale: float, w: int, h: int) -> None:
+    """Draw a track trail with one vectorized sanitation pass.
+
+    All segments go through a single ``cv2.polylines`` call instead of one
+    ``cv2.line`` pybind trip per segment; runs of consecutive finite points
+    become separate polylines so invalid points still break the trail.
+    """
+    if not isinstance(trail, (list, tuple, deque)) or len(trail) < 2:
+        return
+    try:
+        pts = np.asarray(trail, dtype=np.float32).reshape(-1, 2)
+    except ValueError:
+        return
+    if scale != 1.0:
+        pts = pts * scale
+    finite = np.isfinite(pts).all(axis=1)
+    pts = np.where(finite[:, None], pts, 0.0)
+    np.clip(pts[:, 0], 0, w - 1, out=pts[:, 0])
+    np.clip(pts[:, 1], 0, h - 1, out=pts[:, 1])
+    pts = pts.astype(np.int32).reshape(-1, 1, 2)
+    if finite.all():
+        segments = [pts]
+    else:
+        edges = np.flatnonzero(np.diff(finite.astype(np.int8)))
+        bounds = np.concatenate(([0], edges + 1, [len(finite)]))
+        segments = [
+            pts[s:e]
+            for s, e in zip(bounds[:-1], bounds[1:])
+            if finite[s] and e - s >= 2
+        ]
+    if segments:
+        cv2.polylines(
+            frame, segments, False, (0, 0, 255), 2, lineType=cv2.LINE_8
+        )
+
+
 def _draw_track(
-    frame, info: Dict, scale: float, show_ids: bool, show_track_lines: bool
+    frame,
+    info: Dict,
+    scale: float,
+    show_ids: bool,
+    show_track_lines: bool,
+    bbox=_UNSET,
 ) -> None:
-    """Render a single track on ``frame``."""
+    """Render a single track on ``frame``.
+
+    ``bbox`` may carry a pre-sanitized box from the batched path in
+    :func:`draw_overlays`; when omitted it is computed here.
+    """
     h, w = frame.shape[:2]
-    bbox_raw = info.get("bbox", (0, 0, 0, 0))
-    if scale != 1.0:
-        bbox_raw = tuple(v * scale for v in bbox_raw)
-    bbox = _sanitize_bbox(bbox_raw, w, h)
+    if bbox is _UNSET:
+        bbox_raw = info.get("bbox", (0, 0, 0, 0))
+        if scale != 1.0:
+            bbox_raw = tuple(v * scale for v in bbox_raw)
+        bbox = _sanitize_bbox(bbox_raw, w, h)
 
     color = (0, 255, 0) if info.get("zone") == "right" else (0, 0, 255)
     if show_track_lines and bbox:
         x1, y1, x2, y2 = bbox
         cv2.rectangle(frame, (x1, y1), (x2, y2), color, 2, lineType=cv2.LINE_8)
     if show_track_lines:
-        trail = info.get("trail", [])
-        if not isinstance(trail, (list, tuple)):
-            trail = []
-        for i in range(1, len(trail)):
-            x1, y1 = trail[i - 1]
-            x2, y2 = trail[i]
-            if scale != 1.0:
-                p1 = _sanitize_point(x1 * scale, y1 * scale, w, h)
-                p2 = _sanitize_point(x2 * scale, y2 * scale, w, h)
-            else:
-                p1 = _sanitize_point(x1, y1, w, h)
-                p2 = _sanitize_point(x2, y2, w, h)
-            if p1 and p2:
-                cv2.line(frame, p1, p2, (0, 0, 255), 2)
+        _draw_trail(frame, info.get("trail", []), scale, w, h)
     if show_ids and bbox:
         x1, y1, _, _ = bbox
         label = info.get("group", "")
@@ -88,44 +190,56 @@ def _draw_track(
         if label:
             parts.append(str(label))
         text = " ".join(parts)
-        cv2.putText(
-            frame,
-            text,
-            (x1, y1 - 10),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.5,
-            color,
-            2,
-            lineType=cv2.LINE_8,
-        )
+        _blit_text(frame, text, (x1, y1 - 10), 0.5, color, 2)
 
 
-def _draw_counts(frame, in_count: int, out_count: int) -> None:
-    """Display entry and exit counts on ``frame``."""
+@lru_cache(maxsize=64)
+def _counts_patch(in_count: int, out_count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Rasterize the count texts once per distinct ``(in, out)`` pair.
+
+    ``cv2.putText`` re-renders every glyph on every call, but counts change
+    far less often than the frame rate. The prerendered patch plus its
+    non-zero mask lets :func:`_draw_counts` composite with a masked blit.
+    """
     enter_text = f"Entering: {in_count}"
-    _get_text_size(enter_text, cv2.FONT_HERSHEY_SIMPLEX, 1, 2)
+    exit_text = f"Exiting: {out_count}"
+    ew = _get_text_size(enter_text, cv2.FONT_HERSHEY_SIMPLEX, 1, 2)[0]
+    xw = _get_text_size(exit_text, cv2.FONT_HERSHEY_SIMPLEX, 1, 2)[0]
+    patch = np.zeros((90, max(ew, xw) + 2, 3), dtype=np.uint8)
     cv2.putText(
-        frame,
+        patch,
         enter_text,
-        (10, 30),
+        (0, 30),
         cv2.FONT_HERSHEY_SIMPLEX,
         1,
         (0, 255, 0),
         2,
         lineType=cv2.LINE_8,
     )
-    exit_text = f"Exiting: {out_count}"
-    _get_text_size(exit_text, cv2.FONT_HERSHEY_SIMPLEX, 1, 2)
     cv2.putText(
-        frame,
+        patch,
         exit_text,
-        (10, 70),
+        (0, 70),
         cv2.FONT_HERSHEY_SIMPLEX,
         1,
         (0, 0, 255),
         2,
         lineType=cv2.LINE_8,
     )
+    return patch, patch.any(axis=2)
+
+
+def _draw_counts(frame, in_count: int, out_count: int) -> None:
+    """Display entry and exit counts on ``frame``."""
+    patch, mask = _counts_patch(int(in_count), int(out_count))
+    h, w = frame.shape[:2]
+    ph = min(patch.shape[0], h)
+    pw = min(patch.shape[1], max(0, w - 10))
+    if not ph or not pw:
+        return
+    region = frame[:ph, 10 : 10 + pw]
+    sub = mask[:ph, :pw]
+    region[sub] = patch[:ph, :pw][sub]
 
 
 # draw_overlays routine
@@ -171,20 +285,42 @@ def draw_overlays(
     if show_lines:
         _draw_counting_line(frame, line_orientation, line_ratio)
 
-    for tid, info in tracks.items():
-        track_info = {"id": tid, **info}
-        _draw_track(frame, track_info, scale, show_ids, show_track_lines)
+    if tracks:
+        # Sanitize every bbox in one NumPy pass; the cv2 calls stay
+        # per-track (OpenCV has no batch rectangle API) but the Python
+        # per-coordinate checks no longer do.
+        track_list = list(tracks.items())
+        try:
+            boxes = np.asarray(
+                [info.get("bbox", (0, 0, 0, 0)) for _, info in track_list],
+                dtype=np.float32,
+            ).reshape(-1, 4)
+        except ValueError:
+            boxes = np.zeros((len(track_list), 4), dtype=np.float32)
+        if scale != 1.0:
+            boxes *= scale
+        clamped, valid = _sanitize_bboxes(boxes, w, h)
+        for (tid, info), box, ok in zip(track_list, clamped, valid):
+            track_info = {"id": tid, **info}
+            bbox = (int(box[0]), int(box[1]), int(box[2]), int(box[3])) if ok else None
+            _draw_track(
+                frame, track_info, scale, show_ids, show_track_lines, bbox=bbox
+            )
 
     if show_counts:
         _draw_counts(frame, in_count, out_count)
 
     if face_boxes:
-        for box in face_boxes:
-            if scale != 1.0:
-                box = tuple(v * scale for v in box)
-            bbox = _sanitize_bbox(box, w, h)
-            if bbox:
-                x1, y1, x2, y2 = bbox
-                cv2.rectangle(
-                    frame, (x1, y1), (x2, y2), (255, 255, 0), 2, lineType=cv2.LINE_8
-                )
+        fboxes = np.asarray(face_boxes, dtype=np.float32).reshape(-1, 4)
+        if scale != 1.0:
+            fboxes *= scale
+        clamped, valid = _sanitize_bboxes(fboxes, w, h)
+        for box in clamped[valid]:
+            cv2.rectangle(
+                frame,
+                (int(box[0]), int(box[1])),
+                (int(box[2]), int(box[3])),
+                (255, 255, 0),
+                2,
+                lineType=cv2.LINE_8,
+            )
@@ -1,5 +1,6 @@
 """Utilities for profiling threads and inference performance."""
 
+import os
 import threading
 import time
 from dataclasses import dataclass, field
@@ -14,7 +15,7 @@ class ProfilerState:
     """Holds profiling state for threads and inference timings."""
 
     thread_tags: Dict[int, str] = field(default_factory=dict)
-    last_cpu_times: Dict[int, tuple[float, float]] = field(default_factory=dict)
+    last_cpu_times: Dict[int, tuple[float, int]] = field(default_factory=dict)
     last_inference: Dict[str, float] = field(default_factory=dict)
 
 
@@ -40,42 +41,83 @@ def log_inference(
 # profile_predict routine
 def profile_predict(model, tag: str, *args, **kwargs):
     """Wrap YOLOv8 ``predict`` and log inference duration."""
-    start = time.time()
+    start = time.monotonic_ns()
     res = model.predict(*args, **kwargs)
-    log_inference(tag, time.time() - start)
+    log_inference(tag, (time.monotonic_ns() - start) * 1e-9)
     return res
 
 
 # _calc_cpu_percent routine
 def _calc_cpu_percent(
-    state: ProfilerState, tid: int, cpu_time: float, now: float
+    state: ProfilerState, tid: int, cpu_time: float, now_ns: int
 ) -> float:
+    """Update per-thread CPU bookkeeping; ``now_ns`` is monotonic time.
+
+    Monotonic integer timestamps keep intervals correct across NTP clock
+    steps and avoid the float precision loss of epoch seconds.
+    """
     last = state.last_cpu_times.get(tid)
     if not last:
-        state.last_cpu_times[tid] = (cpu_time, now)
+        state.last_cpu_times[tid] = (cpu_time, now_ns)
         return 0.0
     diff = cpu_time - last[0]
-    interval = now - last[1]
-    state.last_cpu_times[tid] = (cpu_time, now)
+    interval = (now_ns - last[1]) * 1e-9
+    state.last_cpu_times[tid] = (cpu_time, now_ns)
     if interval <= 0:
         return 0.0
     return (diff / interval) * 100.0 / psutil.cpu_count()
 
 
+# Linux exposes per-thread CPU times in /proc; elsewhere (or if the layout
+# is unexpected) we fall back to psutil's full thread enumeration.
+_HAS_PROC_TASKS = os.path.isdir(f"/proc/{os.getpid()}/task")
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+def _thread_cpu_time(tid: int) -> Optional[float]:
+    """Return user+system CPU seconds for thread ``tid`` from /proc."""
+    try:
+        fd = os.open(f"/proc/{_process.pid}/task/{tid}/stat", os.O_RDONLY)
+        try:
+            data = os.read(fd, 1024)
+        finally:
+            os.close(fd)
+        # comm (field 2) may contain spaces; count fields after its closing
+        # paren. utime/stime are stat fields 14 and 15.
+        fields = data[data.rfind(b")") + 2 :].split()
+        return (int(fields[11]) + int(fields[12])) / _CLK_TCK
+    except (OSError, IndexError, ValueError):
+        return None
+
+
 # _collect_stats routine
 def _collect_stats(
     state: ProfilerState = default_state,
 ) -> Dict[str, tuple[float, float, Optional[float]]]:
-    """Return stats for registered threads."""
+    """Return stats for registered threads.
+
+    Only tagged threads are touched: each one costs a single /proc stat
+    read instead of enumerating every OS thread of the process and
+    discarding the untagged majority.
+    """
     mem = _process.memory_info().rss / (1024 * 1024)
-    now = time.time()
+    now = time.monotonic_ns()
     stats = {}
-    for th in _process.threads():
-        tid = th.id
-        tag = state.thread_tags.get(tid)
-        if not tag:
-            continue
-        cpu_time = th.user_time + th.system_time
+    fallback: Optional[Dict[int, float]] = None
+    for tid, tag in list(state.thread_tags.items()):
+        cpu_time = _thread_cpu_time(tid) if _HAS_PROC_TASKS else None
+        if cpu_time is None:
+            if _HAS_PROC_TASKS:
+                # /proc entry gone: the thread has exited.
+                continue
+            if fallback is None:
+                fallback = {
+                    th.id: th.user_time + th.system_time
+                    for th in _process.threads()
+                }
+            cpu_time = fallback.get(tid)
+            if cpu_time is None:
+                continue
         cpu_pct = _calc_cpu_percent(state, tid, cpu_time, now)
         inf = state.last_inference.get(tag)
         stats[tag] = (cpu_pct, mem, inf)
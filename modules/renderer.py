@@ -1,13 +1,21 @@
 """Separate renderer process for drawing overlays.
 
-The renderer receives tracking metadata via a ``multiprocessing.Queue`` and
-reads frames from shared memory to avoid copying between processes.  The
-resulting overlay frame is written back to shared memory for consumers.
+The renderer reads frames and track state from shared memory to avoid
+copying between processes.  Track bounding boxes, ids and trails travel in
+a preallocated struct-of-arrays block; only a small control record (flags,
+counts, per-track labels) goes through the ``multiprocessing.Queue``, so
+the per-frame pickle of the full tracks dict is gone.  Frames page-flip
+between two shared buffers: the producer writes into one while the
+renderer draws overlays in place on the other, eliminating the separate
+input-to-output frame copy.  Consumers read the last completed buffer via
+:attr:`RendererProcess.output`.
 """
 
 from __future__ import annotations
 
 import multiprocessing as mp
+from collections import deque
+from itertools import islice
 from multiprocessing import shared_memory
 from typing import Dict, Tuple
 
@@ -15,27 +23,72 @@ import numpy as np
 
 from .overlay import draw_overlays
 
+# Capacity of the shared track block.  Tracks beyond these bounds are
+# truncated (oldest trail points dropped first), which matches what the
+# overlay can usefully display anyway.
+N_MAX_TRACKS = 128
+TRAIL_MAX = 64
+
+
+def _soa_views(buf) -> Tuple[np.ndarray, ...]:
+    """Return (bboxes, ids, zones, confs, trail_lens, trails) views on ``buf``."""
+    offset = 0
+
+    def view(shape, dtype):
+        nonlocal offset
+        arr = np.ndarray(shape, dtype=dtype, buffer=buf, offset=offset)
+        offset += arr.nbytes
+        return arr
+
+    bboxes = view((N_MAX_TRACKS, 4), np.float32)
+    ids = view((N_MAX_TRACKS,), np.int64)
+    zones = view((N_MAX_TRACKS,), np.uint8)
+    confs = view((N_MAX_TRACKS,), np.float32)
+    trail_lens = view((N_MAX_TRACKS,), np.int32)
+    trails = view((N_MAX_TRACKS, TRAIL_MAX, 2), np.float32)
+    return bboxes, ids, zones, confs, trail_lens, trails
+
+
+_SOA_NBYTES = N_MAX_TRACKS * (4 * 4 + 8 + 1 + 4 + 4 + TRAIL_MAX * 2 * 4)
+
 
 def _render_loop(
-    shm_in_name: str,
-    shm_out_name: str,
+    shm_frame_names: Tuple[str, str],
+    shm_tracks_name: str,
     queue: mp.Queue,
+    done_idx: "mp.Value",
     shape: Tuple[int, int, int],
 ) -> None:
     """Process target that draws overlays on frames in shared memory."""
-    shm_in = shared_memory.SharedMemory(name=shm_in_name)
-    shm_out = shared_memory.SharedMemory(name=shm_out_name)
-    frame = np.ndarray(shape, dtype=np.uint8, buffer=shm_in.buf)
-    out = np.ndarray(shape, dtype=np.uint8, buffer=shm_out.buf)
+    shms = [shared_memory.SharedMemory(name=name) for name in shm_frame_names]
+    shm_tracks = shared_memory.SharedMemory(name=shm_tracks_name)
+    frames = [np.ndarray(shape, dtype=np.uint8, buffer=shm.buf) for shm in shms]
+    bboxes, ids, zones, confs, trail_lens, trails = _soa_views(shm_tracks.buf)
+    groups: tuple = ()
     while True:
         msg = queue.get()
         if msg is None:
             break
-        tracks: Dict[int, dict] = msg["tracks"]
         flags: Dict[str, bool] = msg["flags"]
-        out[:] = frame
+        n = msg.get("n_tracks", 0)
+        if msg.get("groups") is not None:
+            groups = msg["groups"]
+        tracks: Dict[int, dict] = {}
+        for i in range(n):
+            conf = float(confs[i])
+            t = int(trail_lens[i])
+            tracks[int(ids[i])] = {
+                "bbox": tuple(bboxes[i]),
+                "zone": "right" if zones[i] else "",
+                "conf": None if np.isnan(conf) else conf,
+                "group": groups[i] if i < len(groups) else "",
+                "trail": [tuple(p) for p in trails[i, :t]],
+            }
+        idx = msg.get("idx", 0)
+        # Draw in place on the buffer the producer just finished writing;
+        # the producer is busy filling the other buffer by now.
         draw_overlays(
-            out,
+            frames[idx],
             tracks,
             flags.get("show_ids", False),
             flags.get("show_track_lines", False),
@@ -47,8 +100,10 @@ def _render_loop(
             msg.get("out_count", 0),
             msg.get("face_boxes"),
         )
-    shm_in.close()
-    shm_out.close()
+        done_idx.value = idx
+    for shm in shms:
+        shm.close()
+    shm_tracks.close()
 
 
 class RendererProcess:
@@ -57,18 +112,125 @@ class RendererProcess:
     def __init__(self, shape: Tuple[int, int, int]) -> None:
         ctx = mp.get_context("spawn")
         nbytes = int(np.prod(shape) * np.dtype("uint8").itemsize)
-        self.shm_in = shared_memory.SharedMemory(create=True, size=nbytes)
-        self.shm_out = shared_memory.SharedMemory(create=True, size=nbytes)
-        self.frame = np.ndarray(shape, dtype=np.uint8, buffer=self.shm_in.buf)
-        self.output = np.ndarray(shape, dtype=np.uint8, buffer=self.shm_out.buf)
+        self.shm_frames = [
+            shared_memory.SharedMemory(create=True, size=nbytes) for _ in range(2)
+        ]
+        self.shm_tracks = shared_memory.SharedMemory(create=True, size=_SOA_NBYTES)
+        self._frames = [
+            np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+            for shm in self.shm_frames
+        ]
+        # Producer writes into ``_write_idx``; the renderer publishes the
+        # index of the last fully drawn buffer through ``_done_idx``.
+        self._write_idx = 0
+        self._done_idx = ctx.Value("i", 0)
+        self._last_groups: tuple = ()
+        (
+            self._bboxes,
+            self._ids,
+            self._zones,
+            self._confs,
+            self._trail_lens,
+            self._trails,
+        ) = _soa_views(self.shm_tracks.buf)
         self.queue: mp.Queue = ctx.Queue(maxsize=1)
         self.process = ctx.Process(
             target=_render_loop,
-            args=(self.shm_in.name, self.shm_out.name, self.queue, shape),
+            args=(
+                tuple(shm.name for shm in self.shm_frames),
+                self.shm_tracks.name,
+                self.queue,
+                self._done_idx,
+                shape,
+            ),
             daemon=True,
         )
         self.process.start()
 
+    @property
+    def frame(self) -> np.ndarray:
+        """The buffer the producer should write the next frame into."""
+        return self._frames[self._write_idx]
+
+    @property
+    def output(self) -> np.ndarray:
+        """The most recently rendered overlay frame."""
+        return self._frames[self._done_idx.value]
+
+    def publish(
+        self,
+        frame: np.ndarray,
+        tracks: Dict[int, dict],
+        flags: Dict[str, bool],
+        line_orientation: str,
+        line_ratio: float,
+        in_count: int,
+        out_count: int,
+        face_boxes=None,
+    ) -> None:
+        """Copy ``frame`` and track state to shared memory and signal the renderer.
+
+        Numeric per-track state (bbox, zone, conf, trail) is written into
+        the preallocated struct-of-arrays; the queue carries only a small
+        control record with the scalar settings and per-track labels.  The
+        renderer draws overlays directly on the published buffer while the
+        producer moves on to the other one.
+        """
+        idx = self._write_idx
+        self._frames[idx][:] = frame
+        n = 0
+        groups = []
+        for tid, info in tracks.items():
+            if n >= N_MAX_TRACKS:
+                break
+            bbox = info.get("bbox", (0, 0, 0, 0))
+            try:
+                self._bboxes[n] = bbox
+            except ValueError:
+                self._bboxes[n] = (0, 0, 0, 0)
+            try:
+                self._ids[n] = int(tid)
+            except (TypeError, ValueError):
+                self._ids[n] = -1
+            self._zones[n] = 1 if info.get("zone") == "right" else 0
+            conf = info.get("conf")
+            self._confs[n] = np.nan if conf is None else conf
+            trail = info.get("trail") or []
+            if not isinstance(trail, (list, tuple, deque)):
+                trail = []
+            t = min(len(trail), TRAIL_MAX)
+            if t:
+                # Trails arrive as bounded deques, which don't slice;
+                # islice keeps the newest points without a copy per frame.
+                if t != len(trail):
+                    trail = list(islice(trail, len(trail) - t, len(trail)))
+                try:
+                    self._trails[n, :t] = trail
+                except ValueError:
+                    t = 0
+            self._trail_lens[n] = t
+            groups.append(str(info.get("group", "")))
+            n += 1
+        # Labels rarely change between frames; send None when they match
+        # the previous publish so the control record stays a few bytes.
+        groups_t = tuple(groups)
+        groups_msg = None if groups_t == self._last_groups else groups_t
+        self._last_groups = groups_t
+        self.queue.put(
+            {
+                "idx": idx,
+                "n_tracks": n,
+                "groups": groups_msg,
+                "flags": flags,
+                "line_orientation": line_orientation,
+                "line_ratio": line_ratio,
+                "in_count": in_count,
+                "out_count": out_count,
+                "face_boxes": face_boxes,
+            }
+        )
+        self._write_idx = 1 - idx
+
     def close(self) -> None:
         """Shut down the renderer process and release shared memory."""
         try:
@@ -76,7 +238,8 @@ class RendererProcess:
             if self.process.is_alive():
                 self.process.join()
         finally:
-            self.shm_in.close()
-            self.shm_in.unlink()
-            self.shm_out.close()
-            self.shm_out.unlink()
+            for shm in self.shm_frames:
+                shm.close()
+                shm.unlink()
+            self.shm_tracks.close()
+            self.shm_tracks.unlink()
@@ -0,0 +1,69 @@
+"""IoU assignment kernel for the lightweight face tracker.
+
+Matches every detection to its best-overlapping track in one pass. When
+Numba is installed the kernel is JIT compiled so multi-camera face
+tracking runs outside the GIL; otherwise a broadcast NumPy path is used.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:  # optional acceleration
+    from numba import njit, prange  # type: ignore
+except Exception:  # pragma: no cover - numba optional
+    njit = None
+    prange = range
+
+
+def _assign_iou_numpy(
+    det: np.ndarray, trk: np.ndarray, thresh: float
+) -> np.ndarray:
+    """Vectorized fallback: best track index per detection, -1 if none.
+
+    ``det`` and ``trk`` are ``(N, 4)`` / ``(T, 4)`` xyxy boxes.
+    """
+    ix1 = np.maximum(det[:, None, 0], trk[None, :, 0])
+    iy1 = np.maximum(det[:, None, 1], trk[None, :, 1])
+    ix2 = np.minimum(det[:, None, 2], trk[None, :, 2])
+    iy2 = np.minimum(det[:, None, 3], trk[None, :, 3])
+    inter = np.clip(ix2 - ix1, 0, None) * np.clip(iy2 - iy1, 0, None)
+    area_d = (det[:, 2] - det[:, 0]) * (det[:, 3] - det[:, 1])
+    area_t = (trk[:, 2] - trk[:, 0]) * (trk[:, 3] - trk[:, 1])
+    iou = inter / (area_d[:, None] + area_t[None, :] - inter + 1e-9)
+    best = np.argmax(iou, axis=1).astype(np.int64)
+    best[iou[np.arange(det.shape[0]), best] < thresh] = -1
+    return best
+
+
+if njit is not None:
+
+    @njit(cache=True, parallel=True, fastmath=True)  # pragma: no cover - jit
+    def _assign_iou_jit(det, trk, thresh):
+        n = det.shape[0]
+        t = trk.shape[0]
+        best = np.full(n, -1, np.int64)
+        for i in prange(n):
+            area_d = (det[i, 2] - det[i, 0]) * (det[i, 3] - det[i, 1])
+            best_iou = 0.0
+            best_j = -1
+            for j in range(t):
+                iw = min(det[i, 2], trk[j, 2]) - max(det[i, 0], trk[j, 0])
+                ih = min(det[i, 3], trk[j, 3]) - max(det[i, 1], trk[j, 1])
+                if iw <= 0.0 or ih <= 0.0:
+                    continue
+                inter = iw * ih
+                area_t = (trk[j, 2] - trk[j, 0]) * (trk[j, 3] - trk[j, 1])
+                iou = inter / (area_d + area_t - inter + 1e-9)
+                if iou > best_iou:
+                    best_iou = iou
+                    best_j = j
+            if best_iou >= thresh:
+                best[i] = best_j
+        return best
+
+    assign_iou = _assign_iou_jit
+else:
+    assign_iou = _assign_iou_numpy
+
+__all__ = ["assign_iou"]
@@ -19,13 +19,19 @@ GROUP_ALIASES = {
     "vehicle": {"car", "truck", "bus", "motorbike", "motorcycle", "bicycle"}
 }
 
+# Reverse map built once at import so a label resolves with two lookups
+# instead of scanning every group's alias set per call.
+_ALIAS_TO_CANON = {
+    alias: canon for canon, aliases in GROUP_ALIASES.items() for alias in aliases
+}
+
 
 def resolve_group(label: str, groups: List[str]) -> str | None:
     """Return matching group name for a YOLO label or ``None``."""
-    return next(
-        (g for g in groups if label == g or label in GROUP_ALIASES.get(g, set())),
-        None,
-    )
+    if label in groups:
+        return label
+    canon = _ALIAS_TO_CANON.get(label)
+    return canon if canon is not None and canon in groups else None
 
 
 class Detector:
@@ -34,6 +40,111 @@ class Detector:
     def __init__(self, model: Any, device: Any) -> None:
         self.model = model
         self.device = device
+        # Class-label -> group resolution is invariant for a given
+        # ``groups`` list, so cache it instead of re-resolving all model
+        # labels on every frame.
+        self._group_cache: dict[tuple, tuple] = {}
+        # Per-(groups, device) boolean lookup tensors for on-device masking.
+        self._mask_cache: dict[tuple, Any] = {}
+        # Lone matching class id per groups tuple (None when several map).
+        self._single_cache: dict[tuple, "int | None"] = {}
+        # Scratch buffer for xyxy -> xywh conversion, grown on demand so the
+        # steady state does no per-frame allocation.
+        self._xywh_buf: np.ndarray | None = None
+        # Pinned host staging buffer for GPU->CPU box transfers.
+        self._host_buf: Any = None
+
+    def _label_groups(self, groups: List[str]) -> Tuple[np.ndarray, List[str]]:
+        """Return ``(group_ids, group_names)`` for ``groups``, cached.
+
+        ``group_ids`` maps each model class index to an index into
+        ``group_names``, with -1 for classes matching no requested group.
+        The int32 form keeps per-frame masking a single vectorized integer
+        comparison instead of per-element object-dtype comparisons in the
+        interpreter.
+        """
+        key = tuple(groups)
+        entry = self._group_cache.get(key)
+        if entry is None:
+            names = self.model.names
+            if isinstance(names, dict):
+                names = [names[i] for i in range(len(names))]
+            group_names = list(key)
+            group_to_id = {g: i for i, g in enumerate(group_names)}
+            ids = np.fromiter(
+                (
+                    group_to_id.get(resolve_group(n, group_names), -1)
+                    for n in names
+                ),
+                dtype=np.int32,
+                count=len(names),
+            )
+            entry = (ids, group_names)
+            self._group_cache[key] = entry
+        return entry
+
+    def _class_mask(self, groups: List[str], device: Any) -> Any:
+        """Return a per-class boolean tensor (True = class has a group)."""
+        key = (tuple(groups), str(device))
+        lut = self._mask_cache.get(key)
+        if lut is None:
+            lut = torch.as_tensor(
+                self._label_groups(groups)[0] >= 0, device=device
+            )
+            self._mask_cache[key] = lut
+        return lut
+
+    def _single_class_id(self, groups: List[str]) -> "int | None":
+        """Return the lone matching class id, or ``None`` if several map.
+
+        Configs like ``groups=["person"]`` are common; a direct equality
+        against one class id then replaces the whole lookup-table gather.
+        """
+        key = tuple(groups)
+        if key not in self._single_cache:
+            matching = np.flatnonzero(self._label_groups(groups)[0] >= 0)
+            self._single_cache[key] = (
+                int(matching[0]) if matching.size == 1 else None
+            )
+        return self._single_cache[key]
+
+    def _to_host(self, sel_t: Any) -> np.ndarray:
+        """Move selected box rows to the host in one transfer.
+
+        CUDA tensors copy asynchronously into a reused pinned staging
+        buffer — one explicit stream sync instead of an implicit sync per
+        pageable-memory transfer. The returned view is valid until the
+        next call, like the xywh scratch buffer.
+        """
+        if not getattr(sel_t, "is_cuda", False):
+            return sel_t.cpu().numpy()
+        n = sel_t.shape[0]
+        buf = self._host_buf
+        if buf is None or buf.shape[0] < n or buf.dtype != sel_t.dtype:
+            buf = self._host_buf = torch.empty(
+                (max(n, 64), sel_t.shape[1]),
+                dtype=sel_t.dtype,
+                pin_memory=True,
+            )
+        dst = buf[:n]
+        dst.copy_(sel_t, non_blocking=True)
+        torch.cuda.current_stream().synchronize()
+        return dst.numpy()
+
+    def _to_xywh(self, xyxy: np.ndarray) -> np.ndarray:
+        """Convert ``xyxy`` boxes to xywh in the reused scratch buffer.
+
+        The returned view is only valid until the next call; callers
+        materialize tuples from it immediately.
+        """
+        n = xyxy.shape[0]
+        buf = self._xywh_buf
+        if buf is None or buf.shape[0] < n or buf.dtype != xyxy.dtype:
+            buf = self._xywh_buf = np.empty((max(n, 64), 4), dtype=xyxy.dtype)
+        xywh = buf[:n]
+        xywh[:, :2] = xyxy[:, :2]
+        np.subtract(xyxy[:, 2:], xyxy[:, :2], out=xywh[:, 2:])
+        return xywh
 
     def detect(self, frame: Any, groups: List[str]) -> List[Tuple[tuple, float, str]]:
         """Return a list of ``(xywh, conf, group)`` detections."""
@@ -41,101 +152,116 @@ class Detector:
             self.model, "Tracker", frame, device=self.device, verbose=False
         )[0]
         boxes = results.boxes.data
-        if hasattr(boxes, "tolist"):
-            boxes = boxes.tolist()
-        if torch is not None and hasattr(torch, "tensor"):
-            boxes = torch.tensor(boxes)
+        if (
+            torch is not None
+            and hasattr(torch, "Tensor")
+            and isinstance(boxes, torch.Tensor)
+        ):
+            tensor_mode = True
+        elif torch is not None and hasattr(torch, "as_tensor"):
+            # List/array inputs (e.g. mocked results) convert without the
+            # old tolist round-trip; real tensors never reach this branch.
+            boxes = torch.as_tensor(boxes)
             tensor_mode = True
         else:
             boxes = np.asarray(boxes)
             tensor_mode = False
+        sel = None
         if (boxes.numel() if tensor_mode else boxes.size) > 0:
-            cls_idx = (
-                boxes[:, 5].long().cpu().numpy()
-                if tensor_mode
-                else boxes[:, 5].astype(int)
-            )
-            names = [self.model.names[i] for i in range(len(self.model.names))]
-            label_groups = np.array(
-                [resolve_group(n, groups) for n in names], dtype=object
-            )
-            groups_arr = label_groups[cls_idx]
-            mask = groups_arr != None
-            if mask.any():
-                if tensor_mode:
-                    mask_t = torch.from_numpy(mask).to(boxes.device)
-                    xyxy = boxes[mask_t, :4].cpu().numpy()
-                    conf = boxes[mask_t, 4].cpu().numpy()
+            group_ids, group_names = self._label_groups(groups)
+            cid = self._single_class_id(groups)
+            if tensor_mode:
+                # Mask on-device; only the selected rows cross to the host,
+                # in one transfer instead of per-column syncs.
+                cls_t = boxes[:, 5].long()
+                if cid is not None:
+                    mask_t = cls_t == cid
                 else:
-                    xyxy = boxes[mask, :4]
-                    conf = boxes[mask, 4]
-                xywh = xyxy.copy()
-                xywh[:, 2:] -= xywh[:, :2]
-                detections = list(
-                    zip(
-                        map(tuple, xywh.tolist()),
-                        conf.tolist(),
-                        groups_arr[mask].tolist(),
-                    )
-                )
+                    mask_t = self._class_mask(groups, boxes.device)[cls_t]
+                if bool(mask_t.any()):
+                    sel = self._to_host(boxes[mask_t])
             else:
-                detections = []
-        else:
-            detections = []
-        return detections
+                cls = boxes[:, 5].astype(int)
+                mask = cls == cid if cid is not None else group_ids[cls] >= 0
+                if mask.any():
+                    sel = boxes[mask]
+        if sel is None:
+            return []
+        xyxy = sel[:, :4]
+        conf = sel[:, 4]
+        groups_sel = [group_names[i] for i in group_ids[sel[:, 5].astype(int)]]
+        xywh = self._to_xywh(xyxy)
+        return [
+            ((r[0], r[1], r[2], r[3]), c, g)
+            for r, c, g in zip(xywh.tolist(), conf.tolist(), groups_sel)
+        ]
 
     def detect_batch(
         self, frames: List[Any], groups: List[str]
     ) -> List[List[Tuple[tuple, float, str]]]:
-        """Run detection on a batch of frames."""
+        """Run detection on a batch of frames.
+
+        Post-processing runs once over the concatenated boxes of the whole
+        batch — one mask build and one host transfer instead of repeating
+        the full conversion pipeline per frame, which would defeat the
+        batched inference that just happened. The class-name/group tables
+        are likewise resolved once per call (and cached per instance), so
+        no per-frame work depends on the model's label count.
+        """
         results = profile_predict(
             self.model, "Tracker", frames, device=self.device, verbose=False
         )
-        batch: List[List[Tuple[tuple, float, str]]] = []
-        for res in results:
-            boxes = res.boxes.data
-            if hasattr(boxes, "tolist"):
-                boxes = boxes.tolist()
-            if torch is not None and hasattr(torch, "tensor"):
-                boxes = torch.tensor(boxes)
-                tensor_mode = True
-            else:
-                boxes = np.asarray(boxes)
-                tensor_mode = False
-            if (boxes.numel() if tensor_mode else boxes.size) > 0:
-                cls_idx = (
-                    boxes[:, 5].long().cpu().numpy()
-                    if tensor_mode
-                    else boxes[:, 5].astype(int)
-                )
-                names = [self.model.names[i] for i in range(len(self.model.names))]
-                label_groups = np.array(
-                    [resolve_group(n, groups) for n in names], dtype=object
-                )
-                groups_arr = label_groups[cls_idx]
-                mask = groups_arr != None
-                if mask.any():
-                    if tensor_mode:
-                        mask_t = torch.from_numpy(mask).to(boxes.device)
-                        xyxy = boxes[mask_t, :4].cpu().numpy()
-                        conf = boxes[mask_t, 4].cpu().numpy()
-                    else:
-                        xyxy = boxes[mask, :4]
-                        conf = boxes[mask, 4]
-                    xywh = xyxy.copy()
-                    xywh[:, 2:] -= xywh[:, :2]
-                    dets = list(
-                        zip(
-                            map(tuple, xywh.tolist()),
-                            conf.tolist(),
-                            groups_arr[mask].tolist(),
-                        )
-                    )
-                else:
-                    dets = []
+        n_frames = len(results)
+        if n_frames == 0:
+            return []
+        group_ids, group_names = self._label_groups(groups)
+        tensor_mode = (
+            torch is not None
+            and hasattr(torch, "Tensor")
+            and isinstance(results[0].boxes.data, torch.Tensor)
+        )
+        if tensor_mode:
+            parts = [r.boxes.data for r in results]
+            all_boxes = parts[0] if n_frames == 1 else torch.cat(parts, 0)
+        else:
+            parts = [
+                np.asarray(r.boxes.data, dtype=float).reshape(-1, 6)
+                for r in results
+            ]
+            all_boxes = parts[0] if n_frames == 1 else np.concatenate(parts, 0)
+        counts = np.array([p.shape[0] for p in parts])
+        if int(counts.sum()) == 0:
+            return [[] for _ in results]
+        cid = self._single_class_id(groups)
+        if tensor_mode:
+            cls_t = all_boxes[:, 5].long()
+            if cid is not None:
+                mask_t = cls_t == cid
             else:
-                dets = []
-            batch.append(dets)
+                mask_t = self._class_mask(groups, all_boxes.device)[cls_t]
+            sel = self._to_host(all_boxes[mask_t])
+            mask = mask_t.cpu().numpy()
+        else:
+            cls = all_boxes[:, 5].astype(int)
+            mask = cls == cid if cid is not None else group_ids[cls] >= 0
+            sel = all_boxes[mask]
+        # Selected detections per frame, recovered from the cumulative mask
+        # count at each frame's end offset.
+        ends = np.cumsum(counts)
+        cum_sel = np.concatenate(([0], np.cumsum(mask)))
+        sel_counts = np.diff(np.concatenate(([0], cum_sel[ends])))
+        xywh = self._to_xywh(sel[:, :4])
+        groups_sel = [group_names[i] for i in group_ids[sel[:, 5].astype(int)]]
+        flat = [
+            ((r[0], r[1], r[2], r[3]), c, g)
+            for r, c, g in zip(xywh.tolist(), sel[:, 4].tolist(), groups_sel)
+        ]
+        batch: List[List[Tuple[tuple, float, str]]] = []
+        start = 0
+        for c in sel_counts:
+            c = int(c)
+            batch.append(flat[start : start + c])
+            start += c
         return batch
 
 
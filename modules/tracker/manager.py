@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import queue
+import threading
 import time
 from collections import deque
 from collections.abc import Iterable
@@ -18,15 +19,20 @@ from redis.exceptions import RedisError
 
 from core.config import ANOMALY_ITEMS
 from modules.profiler import register_thread
+from utils import jsonio
 from utils.gpu import get_device
 from utils.overlay import OverlayThrottler
-from utils.redis import get_sync_client, trim_sorted_set_sync
+from utils.redis import get_sync_client, trim_sorted_set_pipe
 from utils.url import get_stream_type
 
 
 class FaceDetector:
     """Stub detector when face recognition is disabled."""
 
+    # The stub ignores its input, so :func:`_ensure_rgb` can skip the
+    # BGR->RGB conversion entirely.
+    accepts_bgr = True
+
     def detect(self, rgb):  # pragma: no cover - no-op
         return []
 
@@ -34,10 +40,13 @@ class FaceDetector:
         return []
 
 from ..duplicate_filter import DuplicateFilter
+from ..frame_pool import FramePool
 from ..overlay import draw_overlays
 from ..renderer import RendererProcess
 from ..utils import SNAP_DIR, lock
+from ._iou_kernel import assign_iou
 from .detector import Detector
+from .snapshot_writer import SnapshotWriter
 from .stream import CaptureWorker
 from .tracker import Tracker
 
@@ -52,6 +61,99 @@ except Exception:  # pragma: no cover - optional in tests
     DeepSort = None
 
 
+# Bounded trail length per track; deques enforce it without slicing.
+_TRAIL_LEN = 30
+
+
+# TrackStore class encapsulates trackstore behavior
+class TrackStore:
+    """Structure-of-arrays store for confirmed track state.
+
+    Numeric per-track fields live in parallel numpy arrays (boxes, zone
+    codes, confidences) so per-frame geometry can run over every track
+    at once; trails and group labels stay parallel Python lists. The
+    renderer, overlay drawing and management code still consume the old
+    ``{tid: info}`` mapping — that view is built lazily and cached until
+    the arrays are replaced.
+    """
+
+    def __init__(self) -> None:
+        self.ids: list[Any] = []
+        self.boxes = np.empty((0, 4), dtype=np.int64)
+        # 0 = top/left, 1 = bottom/right of the counting line
+        self.zones = np.empty(0, dtype=np.int8)
+        self.confs = np.empty(0, dtype=np.float64)
+        self.trails: list[deque[tuple[int, int]]] = []
+        self.groups: list[str] = []
+        self.orientation = "horizontal"
+        self._view: dict[Any, dict] | None = None
+
+    # replace routine
+    def replace(
+        self, ids, boxes, zones, confs, trails, groups, orientation
+    ) -> None:
+        """Swap in a new frame's state, invalidating the dict view."""
+        self.ids = ids
+        self.boxes = np.asarray(boxes, dtype=np.int64).reshape(-1, 4)
+        self.zones = np.asarray(zones, dtype=np.int8)
+        self.confs = np.asarray(confs, dtype=np.float64)
+        self.trails = trails
+        self.groups = groups
+        self.orientation = orientation
+        self._view = None
+
+    # clear routine
+    def clear(self) -> None:
+        self.replace([], [], [], [], [], [], self.orientation)
+
+    # zone_name routine
+    def zone_name(self, code: int) -> str:
+        """Return the user-facing zone label for a zone code."""
+        if self.orientation == "horizontal":
+            return "bottom" if code else "top"
+        return "right" if code else "left"
+
+    # as_dict routine
+    def as_dict(self) -> dict[Any, dict]:
+        if self._view is None:
+            boxes = self.boxes.tolist()
+            self._view = {
+                tid: {
+                    "bbox": tuple(boxes[i]),
+                    "zone": self.zone_name(int(self.zones[i])),
+                    "trail": self.trails[i],
+                    "group": self.groups[i],
+                    "conf": float(self.confs[i]),
+                }
+                for i, tid in enumerate(self.ids)
+            }
+        return self._view
+
+    def get(self, tid, default=None):
+        return self.as_dict().get(tid, default)
+
+    def items(self):
+        return self.as_dict().items()
+
+    def keys(self):
+        return self.as_dict().keys()
+
+    def values(self):
+        return self.as_dict().values()
+
+    def __getitem__(self, tid):
+        return self.as_dict()[tid]
+
+    def __contains__(self, tid) -> bool:
+        return tid in self.as_dict()
+
+    def __iter__(self):
+        return iter(self.as_dict())
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
 def infer_batch(
     tracker: "PersonTracker", batch: list[np.ndarray], frames: list[np.ndarray]
 ) -> list[Any]:
@@ -61,7 +163,9 @@ def infer_batch(
         for frm, dets in zip(frames, dets_batch):
             if tracker.det_queue.full():
                 try:
-                    tracker.det_queue.get_nowait()
+                    dropped, _ = tracker.det_queue.get_nowait()
+                    if getattr(tracker, "frame_pool", None):
+                        tracker.frame_pool.release(dropped)
                 except queue.Empty:  # pragma: no cover - queue emptied
                     pass
             try:
@@ -74,22 +178,78 @@ def infer_batch(
         return []
 
 
+def _drain(q) -> None:
+    """Discard everything queued without a get/notify cycle per item.
+
+    Plain ``queue.Queue`` instances are cleared in one shot under their
+    mutex; multiprocessing queues (the renderer control channel) fall
+    back to non-blocking gets.
+    """
+    mutex = getattr(q, "mutex", None)
+    if mutex is not None:
+        with mutex:
+            q.queue.clear()
+            q.not_full.notify_all()
+        return
+    try:
+        while True:
+            q.get_nowait()
+    except (queue.Empty, OSError):
+        pass
+
+
+def _ensure_rgb(tracker: "PersonTracker", frame: np.ndarray) -> np.ndarray:
+    """Convert ``frame`` to RGB at most once per processed frame.
+
+    Detectors advertise what they can take: with ``accepts_bgr`` the
+    frame passes through untouched, and with ``requires_contiguous``
+    set false a reversed channel view (zero copy) suffices.  Only
+    detectors needing a real contiguous RGB buffer pay for the
+    conversion, which lives in a reused per-tracker buffer invalidated
+    at the top of :func:`process_frame`.
+    """
+    det = getattr(tracker, "face_detector", None)
+    if det is not None:
+        if getattr(det, "accepts_bgr", False):
+            return frame
+        if not getattr(det, "requires_contiguous", True):
+            return frame[..., ::-1]
+    rgb = getattr(tracker, "_rgb_frame", None)
+    if rgb is not None:
+        return rgb
+    buf = getattr(tracker, "_rgb_buf", None)
+    if buf is None or buf.shape != frame.shape or buf.dtype != frame.dtype:
+        pool = getattr(tracker, "frame_pool", None)
+        buf = pool.acquire(frame.shape, frame.dtype) if pool else np.empty_like(frame)
+        tracker._rgb_buf = buf
+    cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=buf)
+    tracker._rgb_frame = buf
+    return buf
+
+
 def process_frame(
-    tracker: "PersonTracker", frame: np.ndarray, detections: list[Any]
+    tracker: "PersonTracker",
+    frame: np.ndarray,
+    detections: list[Any],
+    ds_tracks: list[Any] | None = None,
 ) -> None:
-    """Process a single frame with associated detections."""
+    """Process a single frame with associated detections.
+
+    ``ds_tracks`` carries tracker output precomputed by the batched
+    update path; when given, the detection/update step is skipped here.
+    """
     purge = getattr(tracker, "_purge_counted", None)
     if purge:
         purge()
+    tracker._rgb_frame = None
     if getattr(tracker, "face_tracking_enabled", False):
         tracker._process_faces(frame)
     updated = False
-    rgb = None
     faces: list[tuple[int, int, int, int, np.ndarray]] = []
     if getattr(tracker, "enable_face_counting", False):
         if not getattr(tracker, "face_detector", None):
             tracker.face_detector = FaceDetector()
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        rgb = _ensure_rgb(tracker, frame)
         for f in tracker.face_detector.detect(rgb):
             l2, t2, r2, b2 = map(int, f.bbox)
             if f.det_score < tracker.face_count_conf:
@@ -101,13 +261,9 @@ def process_frame(
                 continue
             faces.append((l2, t2, r2, b2, f.embedding))
     if getattr(tracker, "tracker", None):
-        if not detections:
+        if ds_tracks is None and not detections:
             now = time.time()
-            interval = (
-                0.0
-                if not getattr(tracker, "detector_fps", 0)
-                else 1.0 / float(tracker.detector_fps)
-            )
+            interval = getattr(tracker, "_det_interval", 0.0)
             last_ts = getattr(tracker, "_last_det_ts", 0.0)
             run_det = interval == 0.0 or now - last_ts >= interval
             if run_det:
@@ -122,123 +278,180 @@ def process_frame(
                 tracker._last_det_ts = now
                 tracker.last_detections = detections
 
-        ds_tracks = tracker.tracker.update_tracks(detections, frame=frame)
-        new_tracks = {}
+        if ds_tracks is None:
+            ds_tracks = tracker.tracker.update_tracks(detections, frame=frame)
         h, w = frame.shape[:2]
-        line_pos = int(
-            (h if tracker.line_orientation == "horizontal" else w) * tracker.line_ratio
+        horizontal = tracker.line_orientation == "horizontal"
+        line_pos = int((h if horizontal else w) * tracker.line_ratio)
+        confirmed = [trk for trk in ds_tracks if trk.is_confirmed()]
+        ids_l = [trk.track_id for trk in confirmed]
+        n_tracks = len(confirmed)
+        # Zone and crossing detection run branchlessly over all tracks at
+        # once on the SoA columns; Python only touches the (rare) tracks
+        # whose zone actually flipped.
+        boxes = (
+            np.asarray([trk.to_ltrb() for trk in confirmed], dtype=np.float64)
+            .reshape(-1, 4)
+            .astype(np.int64)
         )
-        for trk in ds_tracks:
-            if not trk.is_confirmed():
-                continue
-            tid = trk.track_id
-            l, t1, r, b = map(int, trk.to_ltrb())  # noqa: E741
-            cx = (l + r) // 2
-            cy = (t1 + b) // 2
-            if tracker.line_orientation == "horizontal":
-                zone = "top" if cy < line_pos else "bottom"
-            else:
-                zone = "left" if cx < line_pos else "right"
-            prev = tracker.tracks.get(tid, {})
-            prev_zone = prev.get("zone")
-            group = getattr(trk, "det_class", prev.get("group", "person"))
+        centers = (boxes[:, :2] + boxes[:, 2:]) // 2
+        zones_arr = (centers[:, 1 if horizontal else 0] >= line_pos).astype(
+            np.int8
+        )
+        prev_store = tracker.tracks
+        prev_zones = np.full(n_tracks, -1, dtype=np.int8)
+        prev_idx: dict[Any, int] | None = None
+        if isinstance(prev_store, TrackStore):
+            prev_idx = {tid: i for i, tid in enumerate(prev_store.ids)}
+            for i, tid in enumerate(ids_l):
+                j = prev_idx.get(tid)
+                if j is not None:
+                    prev_zones[i] = prev_store.zones[j]
+        else:  # pragma: no cover - plain-dict stores from tests
+            for i, tid in enumerate(ids_l):
+                zone = (prev_store.get(tid) or {}).get("zone")
+                if zone:
+                    prev_zones[i] = int(zone in ("bottom", "right"))
+        count_tasks = bool(
+            {"in_count", "out_count"}
+            & set(getattr(tracker, "tasks", ["in_count", "out_count"]))
+        )
+        # Bind the per-crossing state once; repeated attribute traversal
+        # inside the track loop shows up at multi-camera frame rates.
+        in_counts = tracker.in_counts
+        out_counts = tracker.out_counts
+        counted = tracker._counted
+        cooldown = tracker.count_cooldown
+        cam_id = tracker.cam_id
+        queue_log = tracker._queue_log
+        face_counter = getattr(tracker, "face_counter", None) if faces else None
+        # Face boxes as one array so each crossing tests containment for
+        # all faces with four broadcast comparisons.
+        face_boxes_np = (
+            np.asarray([f[:4] for f in faces], dtype=np.int64)
+            if face_counter is not None
+            else None
+        )
+        flag_ppe = bool(getattr(tracker, "ppe_classes", []))
+        crossed = (prev_zones >= 0) & (prev_zones != zones_arr)
+        entered_arr = zones_arr != 0
+        if tracker.reverse:
+            entered_arr = ~entered_arr
+        boxes_list = boxes.tolist()
+        centers_list = centers.tolist()
+        confs_l: list[float] = []
+        trails_l: list[deque[tuple[int, int]]] = []
+        groups_l: list[str] = []
+        for i, trk in enumerate(confirmed):
+            tid = ids_l[i]
+            l, t1, r, b = boxes_list[i]  # noqa: E741
+            cx, cy = centers_list[i]
+            if prev_idx is not None:
+                j = prev_idx.get(tid)
+                trail = prev_store.trails[j] if j is not None else None
+                prev_group = prev_store.groups[j] if j is not None else "person"
+            else:  # pragma: no cover - plain-dict stores from tests
+                prev = prev_store.get(tid, {})
+                trail = prev.get("trail")
+                prev_group = prev.get("group", "person")
+            if not isinstance(trail, deque):
+                trail = deque(trail or (), maxlen=_TRAIL_LEN)
+            group = getattr(trk, "det_class", prev_group)
             conf = float(getattr(trk, "det_conf", 0.0) or 0.0)
-            trail = prev.get("trail", [])
             trail.append((cx, cy))
-            if len(trail) > 30:
-                trail = trail[-30:]
-            new_tracks[tid] = {
-                "bbox": (l, t1, r, b),
-                "zone": zone,
-                "trail": trail,
-                "group": group,
-                "conf": conf,
-            }
-            if (
-                prev_zone
-                and prev_zone != zone
-                and {"in_count", "out_count"}
-                & set(getattr(tracker, "tasks", ["in_count", "out_count"]))
-            ):
-                if tracker.line_orientation == "horizontal":
-                    entered = prev_zone == "top" and zone == "bottom"
-                else:
-                    entered = prev_zone == "left" and zone == "right"
-                if tracker.reverse:
-                    entered = not entered
+            confs_l.append(conf)
+            trails_l.append(trail)
+            groups_l.append(group)
+            if count_tasks and crossed[i]:
+                entered = bool(entered_arr[i])
                 direction = "in" if entered else "out"
                 now = time.time()
-                last = tracker._counted.get(tid)
-                if not last or now - last[0] >= tracker.count_cooldown:
+                last = counted.get(tid)
+                if not last or now - last[0] >= cooldown:
                     if entered:
-                        tracker.in_counts[group] = tracker.in_counts.get(group, 0) + 1
+                        in_counts[group] = in_counts.get(group, 0) + 1
+                        tracker.in_count += 1
                     else:
-                        tracker.out_counts[group] = tracker.out_counts.get(group, 0) + 1
+                        out_counts[group] = out_counts.get(group, 0) + 1
+                        tracker.out_count += 1
                     updated = True
-                    tracker._counted[tid] = (now, direction)
+                    counted[tid] = (now, direction)
                     ts = int(now)
                     path = None
                     try:
                         crop = frame[t1:b, l:r]
-                        fname = f"{ts}_{tracker.cam_id}_{tid}.jpg"
+                        fname = f"{ts}_{cam_id}_{tid}.jpg"
                         img_path = tracker.snap_dir / fname
-                        cv2.imwrite(str(img_path), crop)
+                        snap_writer = getattr(tracker, "_snap_writer", None)
+                        if snap_writer is not None:
+                            snap_writer.submit(img_path, crop)
+                        else:
+                            params = (
+                                getattr(tracker, "_snap_jpeg_params", None) or []
+                            )
+                            cv2.imwrite(str(img_path), crop, params)
                         path = str(img_path)
                     except Exception:
                         path = None
                     entry = {
                         "ts": ts,
-                        "cam_id": tracker.cam_id,
+                        "cam_id": cam_id,
                         "track_id": tid,
                         "direction": direction,
                         "label": group,
                         "path": path,
                     }
-                    if getattr(tracker, "ppe_classes", []):
+                    if flag_ppe:
                         entry["needs_ppe"] = group == "person"
                     key = "person_logs" if group == "person" else "vehicle_logs"
-                    tracker.redis.zadd(key, {json.dumps(entry): entry["ts"]})
-                    trim_sorted_set_sync(tracker.redis, key, entry["ts"])
-                    if (
-                        getattr(tracker, "enable_face_counting", False)
-                        and getattr(tracker, "face_counter", None)
-                        and faces
-                    ):
-                        for fl, ft, fr, fb, emb in faces:
-                            if fl >= l and ft >= t1 and fr <= r and fb <= b:
-                                if tracker.face_counter.is_new(emb):
-                                    if entered:
-                                        tracker.in_counts["face"] = (
-                                            tracker.in_counts.get("face", 0) + 1
-                                        )
-                                    else:
-                                        tracker.out_counts["face"] = (
-                                            tracker.out_counts.get("face", 0) + 1
-                                        )
-                                    updated = True
-                                    face_entry = {
-                                        "ts": ts,
-                                        "cam_id": tracker.cam_id,
-                                        "track_id": tid,
-                                        "direction": direction,
-                                        "label": "face",
-                                    }
-                                    tracker.redis.zadd(
-                                        "face_logs",
-                                        {json.dumps(face_entry): face_entry["ts"]},
-                                    )
-                                    trim_sorted_set_sync(
-                                        tracker.redis,
-                                        "face_logs",
-                                        face_entry["ts"],
-                                    )
-                                break
-        tracker.tracks = new_tracks
-        if {"in_count", "out_count"} & set(
-            getattr(tracker, "tasks", ["in_count", "out_count"])
-        ):
-            tracker.in_count = sum(tracker.in_counts.values())
-            tracker.out_count = sum(tracker.out_counts.values())
+                    queue_log(key, jsonio.dumps(entry), entry["ts"])
+                    if face_boxes_np is not None:
+                        inside = (
+                            (face_boxes_np[:, 0] >= l)
+                            & (face_boxes_np[:, 1] >= t1)
+                            & (face_boxes_np[:, 2] <= r)
+                            & (face_boxes_np[:, 3] <= b)
+                        )
+                        hits = np.flatnonzero(inside)
+                        # Only the first contained face is considered,
+                        # matching the old early-break behavior.
+                        if hits.size and face_counter.is_new(
+                            faces[int(hits[0])][4]
+                        ):
+                            if entered:
+                                in_counts["face"] = in_counts.get("face", 0) + 1
+                                tracker.in_count += 1
+                            else:
+                                out_counts["face"] = (
+                                    out_counts.get("face", 0) + 1
+                                )
+                                tracker.out_count += 1
+                            updated = True
+                            face_entry = {
+                                "ts": ts,
+                                "cam_id": cam_id,
+                                "track_id": tid,
+                                "direction": direction,
+                                "label": "face",
+                            }
+                            queue_log(
+                                "face_logs",
+                                jsonio.dumps(face_entry),
+                                face_entry["ts"],
+                            )
+        store = TrackStore()
+        store.replace(
+            ids_l,
+            boxes,
+            zones_arr,
+            confs_l,
+            trails_l,
+            groups_l,
+            tracker.line_orientation,
+        )
+        tracker.tracks = store
+        # in_count/out_count are maintained incrementally at each crossing;
+        # reset and reconfiguration paths rebuild them from the dicts.
         if updated and tracker.update_callback:
             try:
                 tracker.update_callback()
@@ -254,34 +467,43 @@ def process_frame(
             "show_face_boxes",
         )
     }
-    processed = frame.copy() if any(debug_flags.values()) else frame
+    processed = frame
     if any(debug_flags.values()):
         face_boxes = None
         if debug_flags["show_face_boxes"]:
             if not getattr(tracker, "face_detector", None):
                 tracker.face_detector = FaceDetector()
-            if rgb is None:
-                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            face_boxes = tracker.face_detector.detect_boxes(rgb)
+            face_boxes = tracker.face_detector.detect_boxes(
+                _ensure_rgb(tracker, frame)
+            )
         if getattr(tracker, "renderer", None):
-            try:
-                while True:
-                    tracker.renderer.queue.get_nowait()
-            except queue.Empty:
-                pass
-            tracker.renderer.frame[:] = frame
-            tracker.renderer.queue.put(
-                {
-                    "tracks": tracker.tracks,
-                    "flags": debug_flags,
-                    "line_orientation": tracker.line_orientation,
-                    "line_ratio": tracker.line_ratio,
-                    "in_count": tracker.in_count,
-                    "out_count": tracker.out_count,
-                    "face_boxes": face_boxes,
-                }
+            _drain(tracker.renderer.queue)
+            tracker.renderer.publish(
+                frame,
+                tracker.tracks,
+                debug_flags,
+                tracker.line_orientation,
+                tracker.line_ratio,
+                tracker.in_count,
+                tracker.out_count,
+                face_boxes,
             )
         else:
+            # Overlays draw into a reused per-tracker buffer so the debug
+            # path stops allocating a full frame copy each iteration. The
+            # buffer is handed to the single preview consumer and
+            # overwritten on the next frame.
+            buf = getattr(tracker, "_overlay_buf", None)
+            if buf is None or buf.shape != frame.shape or buf.dtype != frame.dtype:
+                pool = getattr(tracker, "frame_pool", None)
+                buf = (
+                    pool.acquire(frame.shape, frame.dtype)
+                    if pool
+                    else np.empty_like(frame)
+                )
+                tracker._overlay_buf = buf
+            np.copyto(buf, frame)
+            processed = buf
             draw_overlays(
                 processed,
                 tracker.tracks,
@@ -302,7 +524,13 @@ def process_frame(
             tracker.output_frame = None
     if tracker.out_queue.full():
         try:
-            tracker.out_queue.get_nowait()
+            dropped = tracker.out_queue.get_nowait()
+            # The overlay scratch buffer stays cached on the tracker, so it
+            # must not re-enter the pool as a free buffer.
+            if dropped is not getattr(tracker, "_overlay_buf", None) and getattr(
+                tracker, "frame_pool", None
+            ):
+                tracker.frame_pool.release(dropped)
         except queue.Empty:
             pass
     try:
@@ -350,16 +578,42 @@ class PostProcessWorker:
         t = self.tracker
         register_thread(f"Tracker-{t.cam_id}-post")
         logger.info(f"[{t.cam_id}] post-process loop started")
+        batch_size = getattr(t, "batch_size", 1)
         while t.running or not t.det_queue.empty():
             try:
-                frame, detections = t.det_queue.get(timeout=1)
+                items = [t.det_queue.get(timeout=1)]
             except queue.Empty:
                 continue
-            try:
-                process_frame(t, frame, detections)
-            except Exception:
-                logger.exception(f"[{t.cam_id}] process error")
-            t.debug_stats["last_process_ts"] = time.time()
+            while len(items) < batch_size:
+                try:
+                    items.append(t.det_queue.get_nowait())
+                except queue.Empty:
+                    break
+            # When several frames queued up, embed all their detections in
+            # one embedder pass; the sequential updates reuse the slices.
+            tracks_batch = None
+            if len(items) > 1 and hasattr(
+                getattr(t, "tracker", None), "update_tracks_batch"
+            ):
+                try:
+                    tracks_batch = t.tracker.update_tracks_batch(
+                        [dets for _, dets in items],
+                        [frm for frm, _ in items],
+                    )
+                except Exception:
+                    logger.exception(f"[{t.cam_id}] batched update error")
+                    tracks_batch = None
+            for i, (frame, detections) in enumerate(items):
+                try:
+                    process_frame(
+                        t,
+                        frame,
+                        detections,
+                        tracks_batch[i] if tracks_batch else None,
+                    )
+                except Exception:
+                    logger.exception(f"[{t.cam_id}] process error")
+                t.debug_stats["last_process_ts"] = time.time()
         logger.info(f"[{t.cam_id}] post-process loop stopped")
         if getattr(t, "renderer", None):
             t.renderer.close()
@@ -383,11 +637,7 @@ class ProcessingWorker:
                 continue
             detections = []
             now = time.time()
-            interval = (
-                0.0
-                if not getattr(t, "detector_fps", 0)
-                else 1.0 / float(t.detector_fps)
-            )
+            interval = getattr(t, "_det_interval", 0.0)
             last_ts = getattr(t, "_last_det_ts", 0.0)
             run_det = interval == 0.0 or now - last_ts >= interval
             if run_det and getattr(t, "detector", None):
@@ -402,24 +652,57 @@ class UniqueFaceCounter:
 
     # __init__ routine
     def __init__(self, similarity: float = 0.6, max_age: int = 30) -> None:
-        self.records: deque[tuple[np.ndarray, float]] = deque()
         self.similarity = similarity
         self.max_age = max_age
+        # Recent embeddings live in one preallocated matrix so similarity
+        # against all of them is a single matrix-vector product instead of
+        # a Python loop of dot products. Rows are unit-normalized on
+        # insert, so cosine similarity is a plain dot product afterwards.
+        self._embs: np.ndarray | None = None
+        self._ts = np.empty(0, dtype=np.float64)
+        self._n = 0
 
     # _purge routine
     def _purge(self, now: float) -> None:
-        while self.records and now - self.records[0][1] > self.max_age:
-            self.records.popleft()
+        # Timestamps are appended in order, so the expired prefix is found
+        # with one binary search and dropped by compacting the arrays.
+        drop = int(np.searchsorted(self._ts[: self._n], now - self.max_age, "right"))
+        if drop:
+            n = self._n - drop
+            if n:
+                self._embs[:n] = self._embs[drop : self._n]
+                self._ts[:n] = self._ts[drop : self._n]
+            self._n = n
+
+    # _append routine
+    def _append(self, emb: np.ndarray, now: float) -> None:
+        if self._embs is None or self._n == self._embs.shape[0]:
+            cap = 32 if self._embs is None else int(self._embs.shape[0] * 1.25) + 1
+            embs = np.empty((cap, emb.shape[0]), dtype=np.float32)
+            ts = np.empty(cap, dtype=np.float64)
+            if self._n:
+                embs[: self._n] = self._embs[: self._n]
+                ts[: self._n] = self._ts[: self._n]
+            self._embs, self._ts = embs, ts
+        self._embs[self._n] = emb
+        self._ts[self._n] = now
+        self._n += 1
 
     # is_new routine
     def is_new(self, emb: np.ndarray) -> bool:
         now = time.time()
         self._purge(now)
-        for e, _ in self.records:
-            sim = float(np.dot(e, emb) / (np.linalg.norm(e) * np.linalg.norm(emb)))
-            if sim >= self.similarity:
+        emb = np.asarray(emb, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(emb))
+        if norm == 0.0:
+            return False
+        emb = emb / norm
+        n = self._n
+        if n:
+            sims = self._embs[:n] @ emb
+            if float(sims.max()) >= self.similarity:
                 return False
-        self.records.append((emb, now))
+        self._append(emb, now)
         return True
 
 
@@ -456,25 +739,34 @@ class LightweightFaceTracker:
         self, detections: list[tuple[int, int, int, int, float]]
     ) -> list[tuple[int, tuple[int, int, int, int], float]]:
         """Update tracker with ``detections`` and return active tracks."""
-        assigned: dict[int, bool] = {}
         results: list[tuple[int, tuple[int, int, int, int], float]] = []
-        for x1, y1, x2, y2, conf in detections:
+        if not detections:
+            self.tracks = {}
+            return results
+        new_tracks: dict[int, tuple[int, int, int, int]] = {}
+        best = None
+        track_ids: list[int] = []
+        if self.tracks:
+            # The IoU/argmax matching runs in the shared kernel — JIT
+            # compiled when numba is available, broadcast NumPy otherwise.
+            track_ids = list(self.tracks.keys())
+            det = np.asarray(
+                [d[:4] for d in detections], dtype=np.float64
+            ).reshape(-1, 4)
+            trk = np.asarray(
+                [self.tracks[tid] for tid in track_ids], dtype=np.float64
+            )
+            best = assign_iou(det, trk, self.iou_thresh)
+        for i, (x1, y1, x2, y2, conf) in enumerate(detections):
             best_id = None
-            best_iou = 0.0
-            for tid, bbox in self.tracks.items():
-                iou = _iou(bbox, (x1, y1, x2, y2))
-                if iou > best_iou and iou >= self.iou_thresh:
-                    best_iou = iou
-                    best_id = tid
+            if best is not None and best[i] >= 0:
+                best_id = track_ids[int(best[i])]
             if best_id is None:
                 best_id = self.next_id
                 self.next_id += 1
-            self.tracks[best_id] = (x1, y1, x2, y2)
+            new_tracks[best_id] = (x1, y1, x2, y2)
             results.append((best_id, (x1, y1, x2, y2), conf))
-            assigned[best_id] = True
-        self.tracks = {
-            tid: bbox for tid, bbox in self.tracks.items() if tid in assigned
-        }
+        self.tracks = new_tracks
         return results
 
 
@@ -667,7 +959,7 @@ class PersonTracker:
                         self.face_tracker = LightweightFaceTracker()
                 else:
                     self.face_tracker = LightweightFaceTracker()
-        self.tracks = {}
+        self.tracks = TrackStore()
         self._counted: dict[int, tuple[float, str]] = {}
         self.count_cooldown = cfg.get("count_cooldown", 2)
         try:
@@ -692,14 +984,20 @@ class PersonTracker:
         self.out_counts = {}
         keys_in = [f"{self.key_in}:{g}" for g in self.groups]
         keys_out = [f"{self.key_out}:{g}" for g in self.groups]
-        vals = self.redis.mget(keys_in + keys_out)
+        date_keys = [f"{item}_date" for item in ANOMALY_ITEMS]
+        # All initialization reads go out in one round-trip, and the
+        # derived state is written back with a single mset below.
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.mget(keys_in + keys_out)
+        pipe.get(self.key_date)
+        pipe.mget(date_keys)
+        vals, stored_date, date_vals = pipe.execute()
         split = len(self.groups)
         for idx, g in enumerate(self.groups):
             self.in_counts[g] = int(vals[idx] or 0)
             self.out_counts[g] = int(vals[idx + split] or 0)
         self.in_count = sum(self.in_counts.values())
         self.out_count = sum(self.out_counts.values())
-        stored_date = self.redis.get(self.key_date)
         self.prev_date = (
             date.fromisoformat(stored_date) if stored_date else date.today()
         )
@@ -707,21 +1005,34 @@ class PersonTracker:
         for g in self.groups:
             init_data[f"{self.key_in}:{g}"] = self.in_counts[g]
             init_data[f"{self.key_out}:{g}"] = self.out_counts[g]
-        self.redis.mset(init_data)
         today = date.today().isoformat()
-        date_keys = [f"{item}_date" for item in ANOMALY_ITEMS]
-        date_vals = self.redis.mget(date_keys)
-        anomaly_init: dict[str, Any] = {}
         for item, d_raw in zip(ANOMALY_ITEMS, date_vals):
             d = date.fromisoformat(d_raw) if d_raw else self.prev_date
             if d.isoformat() != today:
-                anomaly_init[f"{item}_count"] = 0
-                anomaly_init[f"{item}_date"] = today
-        if anomaly_init:
-            self.redis.mset(anomaly_init)
+                init_data[f"{item}_count"] = 0
+                init_data[f"{item}_date"] = today
+        self.redis.mset(init_data)
         self.snap_dir = SNAP_DIR
+        # Evidence crops don't need archival quality; a capped JPEG
+        # quality roughly halves the encode time and file size.
+        self._snap_jpeg_params = [
+            int(cv2.IMWRITE_JPEG_QUALITY),
+            int(cfg.get("snapshot_jpeg_quality", 85)),
+        ]
+        # Snapshot encodes and file writes batch on a dedicated thread
+        # instead of one executor dispatch per crop.
+        self._snap_writer = SnapshotWriter(
+            f"snap-{self.cam_id}", self._snap_jpeg_params
+        )
         self.raw_frame = None
         self.output_frame = None
+        # Recycles frames dropped from the queues into scratch buffers
+        self.frame_pool = FramePool()
+        # Reused overlay buffer for the non-renderer debug path
+        self._overlay_buf: np.ndarray | None = None
+        # Memoized BGR->RGB conversion, refreshed per processed frame
+        self._rgb_buf: np.ndarray | None = None
+        self._rgb_frame: np.ndarray | None = None
         # Parameters for the downscaled/throttled preview stream
         self.preview_downscale = cfg.get("preview_downscale", 2)
         self._last_preview_ts = 0.0
@@ -749,12 +1060,38 @@ class PersonTracker:
         self.infer_worker = InferWorker(self)
         self.post_worker = PostProcessWorker(self)
 
+        # Log entries queue here and a dedicated writer thread flushes them
+        # to Redis in pipelined batches, keeping round-trips off the
+        # processing threads entirely.  The writer keys off its own flag
+        # rather than ``running``, which flips False on transient capture
+        # failures the watchdog later recovers from.
+        self._redis_queue: queue.Queue = queue.Queue(maxsize=1024)
+        self._log_writer_running = True
+        self._redis_writer = threading.Thread(
+            target=self._redis_writer_loop,
+            daemon=True,
+            name=f"Tracker-{self.cam_id}-rediswriter",
+        )
+        self._redis_writer.start()
+
     @staticmethod
     # _clean_label routine
     def _clean_label(name: str) -> str:
         """Normalize a label to lowercase with underscores."""
         return name.lower().replace(" ", "_").replace("-", "_").replace("/", "_")
 
+    @property
+    def detector_fps(self):
+        """Detection refresh rate in frames per second."""
+        return self._detector_fps
+
+    @detector_fps.setter
+    def detector_fps(self, value) -> None:
+        # The derived per-frame interval is cached so the frame loops
+        # skip the division and zero checks on every frame.
+        self._detector_fps = value
+        self._det_interval = 1.0 / float(value) if value else 0.0
+
     # _log_process_interval routine
     def _log_process_interval(self, delta: float) -> None:
         """Log processing interval every N frames to avoid log spam."""
@@ -775,7 +1112,7 @@ class PersonTracker:
     def _process_faces(self, frame: np.ndarray) -> None:
         if not (self.face_tracker and self.face_detector):
             return
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        rgb = _ensure_rgb(self, frame)
         faces = self.face_detector.detect(rgb)
         detections = []
         for f in faces:
@@ -808,7 +1145,7 @@ class PersonTracker:
                 fname = f"{int(time.time())}_{self.cam_id}_{tid}.jpg"
                 path = self.snap_dir / fname
                 try:
-                    cv2.imwrite(str(path), crop)
+                    self._snap_writer.submit(path, crop)
                     self.face_best[tid] = (conf, str(path))
                 except Exception:
                     continue
@@ -817,20 +1154,88 @@ class PersonTracker:
             self._log_face_snapshot(tid)
 
     # _log_face_snapshot routine
-    def _log_face_snapshot(self, tid: int) -> None:
+    def _log_face_snapshot(self, tid: int, pipe=None) -> None:
+        """Record the best snapshot of an ended face track.
+
+        With ``pipe`` the zadd/trim go onto the caller's pipeline (used
+        by the shutdown flush); otherwise the entry queues to the
+        background writer.
+        """
         data = self.face_best.pop(tid, None)
         if not data:
             return
         conf, path = data
         ts = int(time.time())
         entry = {"ts": ts, "cam_id": self.cam_id, "track_id": tid, "path": path}
-        self.redis.zadd("face_logs", {json.dumps(entry): ts})
-        trim_sorted_set_sync(self.redis, "face_logs", ts)
+        payload = jsonio.dumps(entry)
+        if pipe is not None:
+            pipe.zadd("face_logs", {payload: ts})
+            trim_sorted_set_pipe(pipe, "face_logs", ts)
+        else:
+            self._queue_log("face_logs", payload, ts)
+
+    # _queue_log routine
+    def _queue_log(self, key: str, payload: str, ts: int) -> None:
+        """Hand a log entry to the background writer without blocking."""
+        try:
+            self._redis_queue.put_nowait((key, payload, ts))
+        except queue.Full:
+            logger.warning(f"[{self.cam_id}] log queue full; dropping entry")
+
+    # _redis_writer_loop routine
+    def _redis_writer_loop(self) -> None:
+        """Drain queued log entries and write them in pipelined batches."""
+        register_thread(f"Tracker-{self.cam_id}-rediswriter")
+        q = self._redis_queue
+        while self._log_writer_running or not q.empty():
+            try:
+                items = [q.get(timeout=0.5)]
+            except queue.Empty:
+                continue
+            while len(items) < 256:
+                try:
+                    items.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                pipe = self.redis.pipeline(transaction=False)
+                for key, payload, ts in items:
+                    pipe.zadd(key, {payload: ts})
+                    trim_sorted_set_pipe(pipe, key, ts)
+                pipe.execute()
+            except Exception:
+                logger.exception(f"[{self.cam_id}] redis log write failed")
+
+    # close routine
+    def close(self) -> None:
+        """Stop the background writers, flushing anything still queued.
+
+        Called on teardown only; transient capture failures flip
+        ``running`` without ending the writers, so queued entries
+        survive a watchdog restart.
+        """
+        self._log_writer_running = False
+        if self._redis_writer.is_alive():
+            self._redis_writer.join(timeout=2.0)
+        self._snap_writer.close()
 
     # _finalize_face_tracks routine
     def _finalize_face_tracks(self) -> None:
-        for tid in list(self.face_best.keys()):
-            self._log_face_snapshot(tid)
+        """Flush every outstanding face track in one pipelined batch.
+
+        Runs at shutdown, after the background writer may already be
+        winding down; writing straight onto a pipeline guarantees the
+        burst lands in a single round trip instead of racing the daemon
+        thread's drain loop.
+        """
+        if self.face_best:
+            try:
+                pipe = self.redis.pipeline(transaction=False)
+                for tid in list(self.face_best.keys()):
+                    self._log_face_snapshot(tid, pipe)
+                pipe.execute()
+            except Exception:
+                logger.exception(f"[{self.cam_id}] face log flush failed")
         self.face_active_ids.clear()
 
     # update_cfg routine
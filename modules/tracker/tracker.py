@@ -22,5 +22,44 @@ class Tracker:
         """Proxy to :meth:`DeepSort.update_tracks`."""
         return self._tracker.update_tracks(detections, frame=frame)
 
+    def update_tracks_batch(
+        self, detections_batch: List[List[Any]], frames: List[Any]
+    ) -> List[Any]:
+        """Update sequentially while embedding a whole micro-batch at once.
+
+        DeepSort embeds the crops of each call separately; for a
+        micro-batch that means one small embedder invocation per frame.
+        Here the crops of all frames are pushed through the embedder in a
+        single forward pass and the per-frame updates (which must stay
+        sequential — the tracker is stateful) receive their slice as
+        precomputed ``embeds``.
+        """
+        embedder = getattr(self._tracker, "embedder", None)
+        crop_bb = getattr(self._tracker, "crop_bb", None)
+        if embedder is None or crop_bb is None:  # pragma: no cover - old API
+            return [
+                self._tracker.update_tracks(dets, frame=frm)
+                for dets, frm in zip(detections_batch, frames)
+            ]
+        crops: List[Any] = []
+        counts: List[int] = []
+        for dets, frm in zip(detections_batch, frames):
+            frame_crops = crop_bb(frm, dets) if dets else []
+            crops.extend(frame_crops)
+            counts.append(len(frame_crops))
+        embeds_flat = embedder.predict(crops) if crops else []
+        out: List[Any] = []
+        start = 0
+        for dets, frm, n in zip(detections_batch, frames, counts):
+            if n:
+                embeds = embeds_flat[start : start + n]
+                start += n
+                out.append(
+                    self._tracker.update_tracks(dets, embeds=embeds, frame=frm)
+                )
+            else:
+                out.append(self._tracker.update_tracks(dets, frame=frm))
+        return out
+
 
 __all__ = ["Tracker"]
@@ -20,6 +20,8 @@ import cv2
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import JSONResponse, RedirectResponse, Response
 from fastapi.templating import Jinja2Templates
+
+from utils.templates import get_templates
 from loguru import logger
 from pydantic import ValidationError
 from starlette.requests import ClientDisconnect
@@ -46,7 +48,7 @@ from modules.stream_probe import check_rtsp
 # this module and affect the admin dependency used below.
 from modules.utils import require_roles
 from schemas.camera import CameraCreate
-from utils import require_feature
+from utils import ensure_feature
 from utils.ffmpeg import _build_timeout_flags, build_snapshot_cmd
 from utils.ffmpeg_snapshot import capture_snapshot
 from utils.url import get_stream_type
@@ -198,7 +200,7 @@ def init_context(
     cams = cameras
     trackers_map = trackers
     redis = redis_client
-    templates = Jinja2Templates(directory=templates_path)
+    templates = get_templates(str(templates_path))
     # Recreate the lock for each new application context
     cams_lock = asyncio.Lock()
     camera_manager = CameraManager(
@@ -728,8 +730,9 @@ async def activate_camera(cam_id: int, request: Request):
 
 
 @router.post("/cameras/{cam_id}/ppe")
-@require_feature("ppe_detection")
 async def toggle_ppe(cam_id: int, request: Request):
+    # Inline licence check: avoids an extra coroutine wrapper per request.
+    ensure_feature("ppe_detection")
     async with cams_lock:
         for cam in cams:
             if cam["id"] == cam_id:
@@ -742,8 +745,8 @@ async def toggle_ppe(cam_id: int, request: Request):
 
 
 @router.post("/cameras/{cam_id}/face_recog")
-@require_feature("face_recognition")
 async def toggle_face_recog(cam_id: int, request: Request):
+    ensure_feature("face_recognition")
     async with cams_lock:
         for cam in cams:
             if cam["id"] == cam_id:
@@ -7,6 +7,8 @@ from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 
+from utils.templates import get_templates
+
 router = APIRouter()
 
 cfg: dict = {}
@@ -17,7 +19,7 @@ def init_context(config: dict, templates_path: str) -> None:
     """Initialize shared module state."""
     global cfg, templates
     cfg = config
-    templates = Jinja2Templates(directory=templates_path)
+    templates = get_templates(str(templates_path))
 
 
 @router.get("/mcp", response_class=HTMLResponse)
@@ -11,6 +11,8 @@ from typing import Dict
 from fastapi import APIRouter, Body, File, Form, HTTPException, Request, UploadFile
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
+
+from utils.templates import get_templates
 from PIL import Image, ImageOps
 
 from utils.ids import generate_id
@@ -31,7 +33,7 @@ def init_context(config: dict, redis_client, templates_path: str) -> None:
     cfg = config
     cfg.setdefault("preferences", {})
     redis = redis_client
-    templates = Jinja2Templates(directory=templates_path)
+    templates = get_templates(str(templates_path))
     tz = cfg["preferences"].get("timezone")
     if tz:
         os.environ["TZ"] = tz
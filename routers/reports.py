@@ -10,6 +10,8 @@ from typing import Dict, List
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import JSONResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
+
+from utils.templates import get_templates
 from loguru import logger
 
 from config import config
@@ -37,7 +39,7 @@ def init_context(
     cfg = config
     trackers_map = trackers
     redis = redis_client
-    templates = Jinja2Templates(directory=templates_path)
+    templates = get_templates(str(templates_path))
     cams = cameras
 
 
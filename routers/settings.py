@@ -12,6 +12,8 @@ from typing import Dict, List
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
 from fastapi.responses import FileResponse, JSONResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
+
+from utils.templates import get_templates
 from loguru import logger
 from starlette.datastructures import FormData
 
@@ -53,7 +55,7 @@ def init_context(
     cams = cameras
     redis = redis_client
     templates_dir = templates_path
-    templates = Jinja2Templates(directory=templates_path)
+    templates = get_templates(str(templates_path))
     cfg_path = config_path
     branding_path = branding_file
     branding = load_branding(branding_file)
@@ -194,7 +196,7 @@ async def settings_page(request: Request):
         # directory that lacks ``settings.html``.  Recreate the templates
         # environment using the original ``templates_dir`` so subsequent
         # requests can still render the built-in templates.
-        templates = Jinja2Templates(directory=templates_dir)
+        templates = get_templates(str(templates_dir))
         return templates.TemplateResponse(
             "settings.html",
             {
@@ -1,5 +1,5 @@
 """Utility package initialization and public exports."""
 
-from .license_guard import require_feature
+from .license_guard import ensure_feature, require_feature
 
-__all__ = ["require_feature"]
+__all__ = ["ensure_feature", "require_feature"]
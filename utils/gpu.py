@@ -4,16 +4,27 @@ from __future__ import annotations
 
 from loguru import logger
 
-try:  # optional heavy dependency
-    import torch  # type: ignore
-except ModuleNotFoundError:  # pragma: no cover - optional in tests
-    torch = None
+# torch is imported lazily via _torch(): the CUDA runtime adds 1+ GB RSS
+# per process, which CPU-only processes and spawn children shouldn't pay.
+torch = None
+
+
+def _torch():
+    """Import torch on first use and cache it in the module global."""
+    global torch
+    if torch is None:
+        try:
+            import torch as _t  # type: ignore
+        except ModuleNotFoundError:  # pragma: no cover - optional in tests
+            return None
+        torch = _t
+    return torch
 
 
 def probe_cuda() -> tuple[bool, int, str | None]:
     """Check CUDA availability and return diagnostics."""
 
-    if torch is None or not hasattr(torch, "cuda"):
+    if _torch() is None or not hasattr(torch, "cuda"):
         logger.debug("torch not available, skipping CUDA probe")
         return False, 0, "torch missing"
 
@@ -106,7 +117,7 @@ def assert_memory(min_gb: float, device: "torch.device | int | None" = None) ->
     Raises:
         RuntimeError: If available GPU memory is below ``min_gb``.
     """
-    if torch is None or not torch.cuda.is_available():
+    if _torch() is None or not torch.cuda.is_available():
         # No GPU available; nothing to assert.
         return
     if device is None:
@@ -142,7 +153,7 @@ def get_device(
     Raises:
         RuntimeError: If a CUDA device is requested but not present.
     """
-    if torch is None or not hasattr(torch, "device"):
+    if _torch() is None or not hasattr(torch, "device"):
         logger.debug("torch not available, using CPU")
         return "cpu"
 
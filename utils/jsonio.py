@@ -0,0 +1,40 @@
+"""JSON encode/decode helpers backed by orjson when available.
+
+``orjson`` serializes typical dicts several times faster than the stdlib
+and emits ``bytes`` that can be handed to Redis or sockets without an
+extra encode step. The stdlib is kept as a drop-in fallback so the
+package works where orjson wheels are unavailable.
+"""
+
+from __future__ import annotations
+
+import json as _json
+from typing import Any
+
+try:  # optional C-accelerated codec
+    import orjson as _orjson  # type: ignore
+except Exception:  # pragma: no cover - orjson optional
+    _orjson = None
+
+if _orjson is not None:
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to JSON bytes."""
+        return _orjson.dumps(obj)
+
+    def loads(data: bytes | str) -> Any:
+        """Deserialize JSON ``data``."""
+        return _orjson.loads(data)
+
+else:  # pragma: no cover - exercised only without orjson
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to JSON bytes."""
+        return _json.dumps(obj).encode()
+
+    def loads(data: bytes | str) -> Any:
+        """Deserialize JSON ``data``."""
+        return _json.loads(data)
+
+
+__all__ = ["dumps", "loads"]
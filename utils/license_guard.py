@@ -10,6 +10,21 @@ from fastapi import HTTPException
 from config import config
 
 
+# ensure_feature routine
+def ensure_feature(feature_name: str) -> None:
+    """Raise ``HTTPException`` unless ``feature_name`` is licensed.
+
+    Plain-call variant of :func:`require_feature` for hot endpoints that
+    cannot afford an extra coroutine wrapper per request.
+    """
+
+    if not config.get("features", {}).get(feature_name, False):
+        raise HTTPException(
+            status_code=403,
+            detail=f"Feature {feature_name} not licensed",
+        )
+
+
 # require_feature routine
 def require_feature(feature_name: str):
     """Ensure ``feature_name`` is enabled in ``config['features']``."""
@@ -32,4 +47,4 @@ def require_feature(feature_name: str):
     return wrapper
 
 
-__all__ = ["require_feature"]
+__all__ = ["ensure_feature", "require_feature"]
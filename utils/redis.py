@@ -43,6 +43,23 @@ def trim_sorted_set_sync(
         asyncio.run(res)
 
 
+def trim_sorted_set_pipe(
+    pipe,
+    key: str,
+    ts: int,
+    retention_secs: Optional[int] = None,
+) -> None:
+    """Queue a retention trim on a pipeline without executing it.
+
+    Lets callers batch the trim together with their other writes into a
+    single round-trip instead of one per logged entry.
+    """
+    if retention_secs is None:
+        days = int(shared_config.get("log_retention_days", 30))
+        retention_secs = days * 24 * 60 * 60
+    pipe.zremrangebyscore(key, 0, ts - retention_secs)
+
+
 # Backwards compatibility alias for deprecated name
 trim_sorted_set_async = trim_sorted_set
 
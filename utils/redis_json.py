@@ -8,9 +8,10 @@ Redis clients are supported.
 from __future__ import annotations
 
 import asyncio
-import json
 from typing import Any
 
+from . import jsonio
+
 
 async def get_json(client, key: str, default: Any | None = None) -> Any | None:
     """Return a decoded JSON value stored at ``key``.
@@ -26,7 +27,7 @@ async def get_json(client, key: str, default: Any | None = None) -> Any | None:
     if data is None:
         return default
     try:
-        return json.loads(data)
+        return jsonio.loads(data)
     except Exception:
         return default
 
@@ -43,7 +44,9 @@ async def set_json(
     and asynchronous Redis clients.
     """
 
-    data = json.dumps(value)
+    # Serialized once as bytes; Redis accepts them directly with no
+    # intermediate str round trip.
+    data = jsonio.dumps(value)
     if expire is not None:
         res = client.set(key, data, ex=expire)
     else:
@@ -0,0 +1,42 @@
+"""Shared Jinja2 template environment construction."""
+
+from __future__ import annotations
+
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+
+from config import config
+
+_BYTECODE_CACHE_DIR = Path(tempfile.gettempdir()) / "zi100_jinja_cache"
+
+
+@lru_cache(maxsize=None)
+def get_templates(directory: str) -> Jinja2Templates:
+    """Return a shared ``Jinja2Templates`` instance for ``directory``.
+
+    Instances are cached per directory so every router renders through the
+    same environment. Unless ``template_auto_reload`` is enabled in the
+    config, ``auto_reload`` is switched off (skipping one ``stat`` per
+    render) and compiled templates are persisted in a filesystem bytecode
+    cache so restarts skip the parse step.
+    """
+
+    templates = Jinja2Templates(directory=directory)
+    if not config.get("template_auto_reload", False):
+        env = templates.env
+        env.auto_reload = False
+        try:
+            _BYTECODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            env.bytecode_cache = FileSystemBytecodeCache(
+                directory=str(_BYTECODE_CACHE_DIR)
+            )
+        except OSError:  # pragma: no cover - cache dir not writable
+            pass
+    return templates
+
+
+__all__ = ["get_templates"]